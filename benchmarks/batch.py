@@ -0,0 +1,63 @@
+"""Measure throughput of run_many compared to a loop of story calls."""
+from collections import deque
+from time import perf_counter
+
+from stories import flatten
+from stories import I
+from stories import run_many
+from stories import State
+from stories import Story
+
+
+class _Check(Story):
+    I.check_balance
+
+    def check_balance(self, state):
+        state.affordable = state.balance > 7
+
+
+class _Purchase(Story):
+    I.find_order
+    I.find_customer
+    I.check
+    I.persist_payment
+
+    def find_order(self, state):
+        state.order = 7
+
+    def find_customer(self, state):
+        state.balance = 8
+
+    def persist_payment(self, state):
+        state.payment = state.order
+
+    def __init__(self):
+        self.check = _Check()
+
+
+def _loop(story, states):
+    for state in states:
+        story(state)
+
+
+def _batch(story, states):
+    deque(run_many(story, states), maxlen=0)
+
+
+def _report(name, run, story, count=100000):
+    states = [State() for _ in range(count)]
+    start = perf_counter()
+    run(story, states)
+    elapsed = perf_counter() - start
+    print(f"{name:<24} {count / elapsed:>10.0f} states/s")
+
+
+def _main():
+    story = _Purchase()
+    _report("story call loop", _loop, story)
+    _report("run_many", _batch, story)
+    _report("run_many flatten", _batch, flatten(story))
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
@@ -0,0 +1,47 @@
+"""Measure latency of coroutine story calls from synchronous code."""
+import asyncio
+from time import perf_counter
+
+from stories import Bridge
+from stories import I
+from stories import State
+from stories import Story
+
+
+class _Purchase(Story):
+    I.find_order
+    I.find_customer
+    I.persist_payment
+
+    async def find_order(self, state):
+        state.order = 7
+
+    async def find_customer(self, state):
+        state.balance = 8
+
+    async def persist_payment(self, state):
+        await asyncio.sleep(0)
+        state.payment = state.order
+
+
+def _report(name, run, count=2000):
+    story = _Purchase()
+    timings = []
+    for _ in range(count):
+        start = perf_counter()
+        run(story, State())
+        timings.append(perf_counter() - start)
+    timings.sort()
+    median = timings[count // 2] * 1e6
+    tail = timings[count * 99 // 100] * 1e6
+    print(f"{name:<16} {median:>8.0f} us median {tail:>8.0f} us p99")
+
+
+def _main():
+    _report("asyncio.run", lambda story, state: asyncio.run(story(state)))
+    with Bridge() as bridge:
+        _report("Bridge", bridge)
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
@@ -0,0 +1,64 @@
+"""Measure tail latency of concurrent stories ordered by latency profile."""
+import asyncio
+from random import Random
+from time import perf_counter
+from time import sleep
+
+from stories import concurrent
+from stories import I
+from stories import Profile
+from stories import State
+from stories import Story
+
+
+class _Purchase(Story):
+    I.render_invoice
+    I.find_order
+    I.find_customer
+    I.persist_payment
+
+    def render_invoice(self, state):
+        sleep(self.latency(0.002))
+        state.invoice = "invoice"
+
+    async def find_order(self, state):
+        await asyncio.sleep(self.latency(0.004))
+        state.order = 7
+
+    async def find_customer(self, state):
+        await asyncio.sleep(self.latency(0.001))
+        state.balance = 8
+
+    async def persist_payment(self, state):
+        await asyncio.sleep(self.latency(0.004))
+        state.payment = state.order
+
+    def latency(self, mean):
+        return mean * self.random.uniform(0.5, 1.5)
+
+    def __init__(self, seed):
+        self.random = Random(seed)
+
+
+def _report(name, profile, count=500):
+    run = concurrent(_Purchase(seed=1), profile)
+    timings = []
+    for _ in range(count):
+        start = perf_counter()
+        asyncio.run(run(State()))
+        timings.append(perf_counter() - start)
+    timings.sort()
+    median = timings[count // 2] * 1e3
+    tail = timings[count * 99 // 100] * 1e3
+    print(f"{name:<24} {median:>8.2f} ms median {tail:>8.2f} ms p99")
+
+
+def _main():
+    _report("declaration order", None)
+    profile = Profile()
+    _report("critical path (cold)", profile)
+    _report("critical path (warm)", Profile(profile.export()))
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
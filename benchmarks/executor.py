@@ -0,0 +1,98 @@
+"""Compare compiled story executor with the step loop it replaced."""
+from timeit import repeat
+
+from stories import I
+from stories import State
+from stories import Story
+
+
+def _loop(steps, story, state):
+    for step in steps:
+        method = getattr(story, step)
+        method(state)
+
+
+async def _async_loop(steps, story, state):
+    for step in steps:
+        method = getattr(story, step)
+        await method(state)
+
+
+def _step(self, state):
+    pass
+
+
+async def _async_step(self, state):
+    pass
+
+
+class _Function(Story):
+    I.s1
+    I.s2
+    I.s3
+    I.s4
+    I.s5
+    I.s6
+    I.s7
+    I.s8
+
+    s1 = s2 = s3 = s4 = s5 = s6 = s7 = s8 = _step
+
+
+class _Coroutine(Story):
+    I.s1
+    I.s2
+    I.s3
+    I.s4
+    I.s5
+    I.s6
+    I.s7
+    I.s8
+
+    s1 = s2 = s3 = s4 = s5 = s6 = s7 = s8 = _async_step
+
+
+class _Mixed(Story):
+    I.s1
+    I.s2
+    I.s3
+    I.s4
+    I.s5
+    I.s6
+    I.s7
+    I.s8
+
+    s1 = _async_step
+    s2 = s3 = s4 = s5 = s6 = s7 = s8 = _step
+
+
+def _drive(coroutine):
+    try:
+        coroutine.send(None)
+    except StopIteration:
+        pass
+
+
+def _report(name, statement, number=100000):
+    best = min(repeat(statement, number=number, repeat=5))
+    print(f"{name:<24} {best / number * 1e9:>8.0f} ns/call")
+
+
+def _main():
+    steps = _Function.__call__.steps
+    story, state = _Function(), State()
+    _report("function loop", lambda: _loop(steps, story, state))
+    execute = story.__call__.__func__
+    _report("function compiled", lambda: execute(story, state))
+    _report("function story call", lambda: story(state))
+    story = _Coroutine()
+    execute = story.__call__.__func__
+    _report("coroutine loop", lambda: _drive(_async_loop(steps, story, state)))
+    _report("coroutine compiled", lambda: _drive(execute(story, state)))
+    _report("coroutine story call", lambda: _drive(story(state)))
+    story = _Mixed()
+    _report("mixed story call", lambda: _drive(story(state)))
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
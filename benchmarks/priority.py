@@ -0,0 +1,65 @@
+"""Measure interactive latency of scheduled stories under a background flood."""
+import asyncio
+from time import perf_counter
+
+from stories import I
+from stories import Scheduler
+from stories import State
+from stories import Story
+
+
+class _Purchase(Story):
+    I.find_order
+    I.find_customer
+    I.persist_payment
+
+    async def find_order(self, state):
+        await asyncio.sleep(0.001)
+        state.order = 7
+
+    async def find_customer(self, state):
+        await asyncio.sleep(0.001)
+        state.balance = 8
+
+    async def persist_payment(self, state):
+        await asyncio.sleep(0.001)
+        state.payment = state.order
+
+
+async def _interactive(run, timings):
+    start = perf_counter()
+    await run(State())
+    timings.append(perf_counter() - start)
+
+
+async def _measure(background, priority, count=200):
+    scheduler = Scheduler(8)
+    flood = [
+        asyncio.create_task(scheduler(_Purchase(), priority)(State()))
+        for _ in range(background)
+    ]
+    timings = []
+    requests = []
+    for _ in range(count):
+        run = scheduler(_Purchase(), 0)
+        requests.append(asyncio.create_task(_interactive(run, timings)))
+        await asyncio.sleep(0.002)
+    await asyncio.gather(*requests, *flood)
+    return sorted(timings)
+
+
+def _report(name, background, priority):
+    timings = asyncio.run(_measure(background, priority))
+    median = timings[len(timings) // 2] * 1e3
+    tail = timings[len(timings) * 99 // 100] * 1e3
+    print(f"{name:<28} {median:>8.2f} ms median {tail:>8.2f} ms p99")
+
+
+def _main():
+    _report("no background", 0, 1)
+    _report("background, same priority", 2000, 0)
+    _report("background, lower priority", 2000, 1)
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
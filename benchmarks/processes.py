@@ -0,0 +1,41 @@
+"""Measure how run_processes scales with the number of processes on CPU steps."""
+from collections import deque
+from time import perf_counter
+
+from stories import I
+from stories import run_many
+from stories import run_processes
+from stories import run_threads
+from stories import State
+from stories import Story
+
+
+class _Price(Story):
+    I.score_risk
+
+    def score_risk(self, state):
+        state.risk = sum(index * index % 7 for index in range(20000))
+
+
+def _report(name, run, count=400):
+    states = [State() for _ in range(count)]
+    start = perf_counter()
+    deque(run(_Price(), states), maxlen=0)
+    elapsed = perf_counter() - start
+    print(f"{name:<24} {count / elapsed:>10.0f} states/s")
+
+
+def _main():
+    _report("run_many", run_many)
+    _report(
+        "run_threads 4 threads", lambda story, states: run_threads(story, states, 4)
+    )
+    for workers in [1, 2, 4, 8]:
+        _report(
+            f"run_processes {workers} workers",
+            lambda story, states: run_processes(story, states, workers, chunksize=16),
+        )
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
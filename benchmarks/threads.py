@@ -0,0 +1,49 @@
+"""Measure how run_threads scales with the number of threads on I/O steps."""
+from collections import deque
+from time import perf_counter
+from time import sleep
+
+from stories import I
+from stories import run_many
+from stories import run_threads
+from stories import State
+from stories import Story
+
+
+class _Purchase(Story):
+    I.find_order
+    I.find_customer
+    I.persist_payment
+
+    def find_order(self, state):
+        sleep(0.001)
+        state.order = 7
+
+    def find_customer(self, state):
+        sleep(0.001)
+        state.balance = 8
+
+    def persist_payment(self, state):
+        sleep(0.001)
+        state.payment = state.order
+
+
+def _report(name, run, count=200):
+    states = [State() for _ in range(count)]
+    start = perf_counter()
+    deque(run(_Purchase(), states), maxlen=0)
+    elapsed = perf_counter() - start
+    print(f"{name:<24} {count / elapsed:>10.0f} states/s")
+
+
+def _main():
+    _report("run_many", run_many)
+    for workers in [1, 2, 4, 8, 16, 32]:
+        _report(
+            f"run_threads {workers:>2} threads",
+            lambda story, states: run_threads(story, states, workers),
+        )
+
+
+if __name__ == "__main__":  # pragma: no branch
+    _main()
@@ -0,0 +1,157 @@
+from asyncio import create_task
+from asyncio import ensure_future
+from asyncio import FIRST_COMPLETED
+from asyncio import gather
+from asyncio import wait
+from collections import deque
+from functools import partial
+from time import perf_counter
+
+
+async def _run_many(execute, states):
+    for state in states:
+        await execute(state)
+        yield state
+
+
+async def _collect_many(execute, states):
+    for state in states:
+        yield await _collect_one(execute, state)
+
+
+async def _run_concurrently(execute, states, limit, ordered, collect):
+    run = partial(runs[collect], execute)
+    tasks = windows[ordered]()
+    feed = feeds[hasattr(states, "__aiter__")]
+    try:
+        async for result in feed(run, states, limit, tasks):
+            yield result
+        while tasks.pending:
+            yield await tasks.next()
+    finally:
+        await _cancel(tasks.pending)
+
+
+async def _feed(run, states, limit, tasks):
+    for state in states:
+        while len(tasks.pending) >= limit.limit:
+            yield await tasks.next()
+        tasks.add(create_task(run(state)))
+
+
+async def _stream(run, states, limit, tasks):
+    source = states.__aiter__()
+    fetch = ensure_future(source.__anext__())
+    try:
+        while True:
+            if len(tasks.pending) >= limit.limit or tasks.ready():
+                yield await tasks.next()
+            else:
+                fetch = await _pull(run, source, fetch, tasks)
+    except StopAsyncIteration:
+        pass
+    finally:
+        await _cancel([fetch])
+
+
+async def _pull(run, source, fetch, tasks):
+    if not fetch.done():
+        await wait(tasks.running() | {fetch}, return_when=FIRST_COMPLETED)
+        return fetch
+    tasks.add(create_task(run(await fetch)))
+    return ensure_future(source.__anext__())
+
+
+async def _measure(execute, limit, state):
+    start = perf_counter()
+    try:
+        await execute(state)
+    except Exception:
+        limit.record(perf_counter() - start, failed=True)
+        raise
+    limit.record(perf_counter() - start)
+
+
+async def _run_one(execute, state):
+    await execute(state)
+    return state
+
+
+async def _collect_one(execute, state):
+    try:
+        await execute(state)
+    except Exception as error:
+        return state, error
+    else:
+        return state, None
+
+
+async def _iterate(states):
+    if hasattr(states, "__aiter__"):
+        async for state in states:
+            yield state
+    else:
+        for state in states:
+            yield state
+
+
+async def _cancel(tasks):
+    for task in tasks:
+        task.cancel()
+    await gather(*tasks, return_exceptions=True)
+
+
+class _Ordered:
+    def __init__(self):
+        self.pending = deque()
+
+    def add(self, task):
+        self.pending.append(task)
+
+    def ready(self):
+        head = self.pending and self.pending[0].done()
+        return head or any(map(_failed, self.pending))
+
+    def running(self):
+        return {task for task in self.pending if not task.done()}
+
+    async def next(self):
+        head = self.pending[0]
+        while not head.done():
+            for task in filter(_failed, self.pending):
+                task.result()
+            await wait(self.running(), return_when=FIRST_COMPLETED)
+        return self.pending.popleft().result()
+
+
+class _Completed:
+    def __init__(self):
+        self.pending = set()
+
+    def add(self, task):
+        self.pending.add(task)
+
+    def ready(self):
+        return any(task.done() for task in self.pending)
+
+    def running(self):
+        return {task for task in self.pending if not task.done()}
+
+    async def next(self):
+        done, _ = await wait(self.pending, return_when=FIRST_COMPLETED)
+        task = done.pop()
+        self.pending.remove(task)
+        return task.result()
+
+
+def _failed(task):
+    return task.done() and task.exception() is not None
+
+
+runs = {True: _collect_one, False: _run_one}
+
+
+feeds = {True: _stream, False: _feed}
+
+
+windows = {True: _Ordered, False: _Completed}
@@ -0,0 +1,21 @@
+def _run_many(execute, states):
+    for state in states:
+        execute(state)
+        yield state
+
+
+def _collect_many(execute, states):
+    for state in states:
+        try:
+            execute(state)
+        except Exception as error:
+            yield state, error
+        else:
+            yield state, None
+
+
+def _run_chunk(execute, collect, chunk):
+    return list(runs[collect](execute, chunk))
+
+
+runs = {True: _collect_many, False: _run_many}
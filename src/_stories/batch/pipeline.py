@@ -0,0 +1,209 @@
+from asyncio import create_task
+from asyncio import Queue as AsyncQueue
+from collections import deque
+from itertools import chain
+from queue import Queue
+from threading import Event
+from threading import Thread
+
+from _stories.batch.coroutine import _cancel
+from _stories.batch.coroutine import _iterate
+from _stories.execute import _is_coroutine
+from _stories.execute import coroutine
+from _stories.execute import function
+from _stories.execute.walk import _walk
+
+
+def _stages(story, awaitable):
+    return [
+        _Stage(method, declaration, awaitable) for method, declaration in _walk(story)
+    ]
+
+
+class _Stage:
+    def __init__(self, method, declaration, awaitable):
+        self.method = method
+        self.declaration = declaration
+        if awaitable:
+            self.invoke = coroutine._invoke
+            self.kind = coroutine._kind(declaration, _is_coroutine(method))
+        else:
+            self.invoke = function._invoke
+            self.kind = declaration.kind
+
+    def __call__(self, state):
+        return self.invoke(self.kind, self.method, state, self.declaration)
+
+
+def _run_threads(stages, workers, states, ordered, collect):
+    queues = [Queue(2 * count) for count in workers] + [Queue()]
+    stop = Event()
+    threads = _start(stages, workers, queues, stop)
+    try:
+        yield from _flow(queues, _window(workers), states, outputs[ordered](), collect)
+    finally:
+        stop.set()
+        _join(threads, queues)
+
+
+def _start(stages, workers, queues, stop):
+    threads = [
+        [Thread(target=_work, args=(stage, inbox, outbox, stop)) for _ in range(count)]
+        for stage, count, inbox, outbox in zip(stages, workers, queues, queues[1:])
+    ]
+    for thread in chain.from_iterable(threads):
+        thread.start()
+    return threads
+
+
+def _flow(queues, window, states, results, collect):
+    pending = 0
+    for item in enumerate(states):
+        if pending >= window:
+            yield _next(results, queues[-1], collect)
+            pending -= 1
+        queues[0].put(item + (None,))
+        pending += 1
+    for _ in range(pending):
+        yield _next(results, queues[-1], collect)
+
+
+def _work(stage, inbox, outbox, stop):
+    for index, state, error in iter(inbox.get, _done):
+        if error is None and not stop.is_set():
+            error = _call(stage, state)
+        outbox.put((index, state, error))
+
+
+def _call(stage, state):
+    try:
+        stage(state)
+    except Exception as error:
+        return error
+
+
+def _next(results, queue, collect):
+    item = results.pop()
+    while item is None:
+        results.push(_check(queue.get(), collect))
+        item = results.pop()
+    return finishes[collect](item)
+
+
+def _join(threads, queues):
+    for group, queue in zip(threads, queues):
+        for _ in group:
+            queue.put(_done)
+        for thread in group:
+            thread.join()
+
+
+async def _run_tasks(stages, workers, states, ordered, collect):
+    queues = [AsyncQueue(2 * count) for count in workers] + [AsyncQueue()]
+    tasks = _spawn(stages, workers, queues)
+    results = outputs[ordered]()
+    try:
+        async for result in _stream(queues, _window(workers), states, results, collect):
+            yield result
+    finally:
+        await _cancel(tasks)
+
+
+def _spawn(stages, workers, queues):
+    return [
+        create_task(_serve(stage, inbox, outbox))
+        for stage, count, inbox, outbox in zip(stages, workers, queues, queues[1:])
+        for _ in range(count)
+    ]
+
+
+async def _stream(queues, window, states, results, collect):
+    pending = 0
+    index = 0
+    async for state in _iterate(states):
+        if pending >= window:
+            yield await _receive(results, queues[-1], collect)
+            pending -= 1
+        await queues[0].put((index, state, None))
+        pending += 1
+        index += 1
+    for _ in range(pending):
+        yield await _receive(results, queues[-1], collect)
+
+
+async def _serve(stage, inbox, outbox):
+    while True:
+        index, state, error = await inbox.get()
+        if error is None:
+            error = await _await(stage, state)
+        await outbox.put((index, state, error))
+
+
+async def _await(stage, state):
+    try:
+        await stage(state)
+    except Exception as error:
+        return error
+
+
+async def _receive(results, queue, collect):
+    item = results.pop()
+    while item is None:
+        results.push(_check(await queue.get(), collect))
+        item = results.pop()
+    return finishes[collect](item)
+
+
+def _window(workers):
+    return 3 * sum(workers)
+
+
+def _check(item, collect):
+    error = item[2]
+    if error is not None and not collect:
+        raise error
+    return item
+
+
+def _collected(item):
+    return item[1], item[2]
+
+
+def _state(item):
+    return item[1]
+
+
+class _Ordered:
+    def __init__(self):
+        self.buffer = {}
+        self.index = 0
+
+    def push(self, item):
+        self.buffer[item[0]] = item
+
+    def pop(self):
+        item = self.buffer.pop(self.index, None)
+        if item is not None:
+            self.index += 1
+        return item
+
+
+class _Completed:
+    def __init__(self):
+        self.buffer = deque()
+
+    def push(self, item):
+        self.buffer.append(item)
+
+    def pop(self):
+        if self.buffer:
+            return self.buffer.popleft()
+
+
+_done = object()
+
+
+outputs = {True: _Ordered, False: _Completed}
+
+
+finishes = {True: _collected, False: _state}
@@ -0,0 +1,58 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from itertools import islice
+
+
+def _run_pool(executor, window, run_chunk, states, chunksize, ordered):
+    futures = windows[ordered]()
+    with executor as pool:
+        try:
+            for chunk in _chunks(states, chunksize):
+                if len(futures.pending) >= window:
+                    yield from futures.next()
+                futures.add(pool.submit(run_chunk, chunk))
+            while futures.pending:
+                yield from futures.next()
+        finally:
+            for future in futures.pending:
+                future.cancel()
+
+
+def _chunks(states, chunksize):
+    states = iter(states)
+    return iter(lambda: list(islice(states, chunksize)), [])
+
+
+class _Ordered:
+    def __init__(self):
+        self.pending = deque()
+
+    def add(self, future):
+        self.pending.append(future)
+
+    def next(self):
+        head = self.pending[0]
+        while not head.done():
+            running = [future for future in self.pending if not future.done()]
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        return self.pending.popleft().result()
+
+
+class _Completed:
+    def __init__(self):
+        self.pending = set()
+
+    def add(self, future):
+        self.pending.add(future)
+
+    def next(self):
+        done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+        future = done.pop()
+        self.pending.remove(future)
+        return future.result()
+
+
+windows = {True: _Ordered, False: _Completed}
@@ -0,0 +1,12 @@
+from _stories.batch import function
+
+
+def _initialize(story):
+    worker["execute"] = story.__call__
+
+
+def _run_chunk(collect, chunk):
+    return function._run_chunk(worker["execute"], collect, chunk)
+
+
+worker = {}
@@ -0,0 +1,75 @@
+import atexit
+from asyncio import all_tasks
+from asyncio import current_task
+from asyncio import gather
+from asyncio import get_running_loop
+from asyncio import new_event_loop
+from asyncio import run_coroutine_threadsafe
+from threading import current_thread
+from threading import Lock
+from threading import Thread
+
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+
+
+class Bridge:
+    """Execute coroutine stories from synchronous code.
+
+    All stories are executed on the same event loop running in a background
+    thread. The loop is started on the first call and stopped on close.
+
+    """
+
+    def __init__(self):
+        self.loop = None
+        self.thread = None
+        self.lock = Lock()
+
+    def __call__(self, story, state):
+        """Execute story with the state and return its result."""
+        if not _is_coroutine(story):
+            raise StoryError("Bridge can execute coroutine stories only")
+        if current_thread() is self.thread:
+            raise StoryError("Bridge can not be called from its own event loop")
+        future = run_coroutine_threadsafe(story(state), self._start())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self):
+        """Cancel stories in progress and stop the event loop with its threads."""
+        with self.lock:
+            if self.loop is not None:
+                run_coroutine_threadsafe(_shutdown(), self.loop).result()
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self.thread.join()
+                self.loop.close()
+                self.loop = self.thread = None
+                atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _start(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop = new_event_loop()
+                self.thread = Thread(target=self.loop.run_forever, daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+            return self.loop
+
+
+async def _shutdown():
+    tasks = all_tasks() - {current_task()}
+    for task in tasks:
+        task.cancel()
+    await gather(*tasks, return_exceptions=True)
+    await get_running_loop().shutdown_asyncgens()
+    await get_running_loop().shutdown_default_executor()
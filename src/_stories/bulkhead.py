@@ -0,0 +1,118 @@
+from asyncio import CancelledError
+from asyncio import get_running_loop
+from collections import deque
+from threading import Event
+from threading import Lock
+from time import perf_counter
+
+from _stories.dataflow import _executor
+
+
+def bulkheads(story):
+    """Find concurrency limits declared for steps of the story.
+
+    Story class or story instance could be given. Every limit is shared by all
+    calls of the story in the process.
+
+    """
+    executor = _executor(story)
+    return {
+        step: declaration.bulkhead
+        for step, declaration in zip(executor.steps, executor.declarations)
+        if declaration.bulkhead is not None
+    }
+
+
+class _Bulkhead:
+    def __init__(self, limit):
+        self.limit = limit
+        self.active = 0
+        self.acquired = 0
+        self.waited = 0.0
+        self.waiters = deque()
+        self.lock = Lock()
+
+    def __repr__(self):
+        return (
+            f"Bulkhead(limit={self.limit}, active={self.active}, "
+            f"waiting={self.waiting})"
+        )
+
+    @property
+    def waiting(self):
+        return len(self.waiters)
+
+    def __enter__(self):
+        with self.lock:
+            waiter = self._admit(_Thread)
+        if waiter is not None:
+            waiter.event.wait()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._release()
+
+    async def __aenter__(self):
+        with self.lock:
+            waiter = self._admit(_Task)
+        if waiter is not None:
+            try:
+                await waiter.future
+            except CancelledError:
+                self._abandon(waiter)
+                raise
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._release()
+
+    def _admit(self, waiter):
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.acquired += 1
+            return None
+        self.waiters.append(waiter(self))
+        return self.waiters[-1]
+
+    def _release(self):
+        with self.lock:
+            if self.waiters:
+                waiter = self.waiters.popleft()
+                self.acquired += 1
+                self.waited += perf_counter() - waiter.start
+                waiter.wake()
+            else:
+                self.active -= 1
+
+    def _abandon(self, waiter):
+        with self.lock:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+                return
+        if not waiter.future.cancelled():
+            self._release()
+
+
+class _Thread:
+    def __init__(self, bulkhead):
+        self.start = perf_counter()
+        self.event = Event()
+
+    def wake(self):
+        self.event.set()
+
+
+class _Task:
+    def __init__(self, bulkhead):
+        self.start = perf_counter()
+        self.bulkhead = bulkhead
+        self.loop = get_running_loop()
+        self.future = self.loop.create_future()
+
+    def wake(self):
+        self.loop.call_soon_threadsafe(_resume, self.bulkhead, self.future)
+
+
+def _resume(bulkhead, future):
+    if future.cancelled():
+        bulkhead._release()
+    else:
+        future.set_result(None)
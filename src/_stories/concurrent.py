@@ -0,0 +1,95 @@
+from asyncio import create_task
+from asyncio import gather
+from functools import partial
+from time import perf_counter
+
+from _stories.dataflow import _depends
+from _stories.dataflow import _effects
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+from _stories.execute import coroutine
+from _stories.execute import function
+from _stories.execute.walk import _walk
+from _stories.profile import _Unprofiled
+
+
+def concurrent(story, profile=None):
+    """Execute independent steps of the coroutine story concurrently.
+
+    Steps of nested stories are resolved once. Step would wait for earlier steps
+    which assign variables it uses or use variables it assigns. Steps declared
+    as ordered would wait for all earlier steps. If profile is given, latency
+    of every step is recorded in it, and steps heading the longest chains of
+    dependent steps are started first.
+
+    """
+    if not _is_coroutine(story.__call__):
+        raise StoryError("concurrent can execute coroutine stories only")
+    return partial(_execute, _plan(story), profile or _Unprofiled())
+
+
+def _plan(story):
+    plan = [_Task(method, declaration) for method, declaration in _walk(story)]
+    for index, task in enumerate(plan):
+        task.dependencies = [
+            number for number, before in enumerate(plan[:index]) if _waits(before, task)
+        ]
+        _link(plan, index)
+    return plan
+
+
+def _link(plan, index):
+    for number in plan[index].dependencies:
+        plan[number].dependents.append(index)
+
+
+class _Task:
+    def __init__(self, method, declaration):
+        self.method = method
+        self.declaration = declaration
+        self.kind = coroutine._kind(declaration, _is_coroutine(method))
+        self.reads, self.writes = _effects(method, declaration)
+        self.name = getattr(method, "__qualname__", None)
+        self.dependents = []
+
+
+def _waits(before, after):
+    return (
+        before.declaration.barrier
+        or after.declaration.barrier
+        or _depends(before, after)
+    )
+
+
+def _schedule(plan, profile):
+    chains = [0.0] * len(plan)
+    for index in reversed(range(len(plan))):
+        task = plan[index]
+        longest = max((chains[number] for number in task.dependents), default=0.0)
+        chains[index] = profile.estimate(task.name) + longest
+    return sorted(range(len(plan)), key=lambda index: (-chains[index], index))
+
+
+async def _execute(plan, profile, state):
+    tasks = {}
+    for index in _schedule(plan, profile):
+        task = plan[index]
+        dependencies = [tasks[number] for number in task.dependencies]
+        tasks[index] = create_task(_run(task, dependencies, profile, state))
+    try:
+        await gather(*tasks.values())
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await gather(*tasks.values(), return_exceptions=True)
+
+
+async def _run(task, dependencies, profile, state):
+    for dependency in dependencies:
+        await dependency
+    if not function._admits(task.declaration, state):
+        return
+    start = perf_counter()
+    await coroutine._invoke(task.kind, task.method, state, task.declaration)
+    if task.name is not None:
+        profile.record(task.name, perf_counter() - start)
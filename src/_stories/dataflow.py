@@ -0,0 +1,256 @@
+import ast
+from inspect import getsource
+from textwrap import dedent
+
+from _stories.execute import _is_story
+
+
+def dataflow(story):
+    """Find state variables each step of the story reads and assigns.
+
+    Story class or story instance could be analyzed. Steps are analyzed by their
+    source code without execution.
+
+    """
+    executor = _executor(story)
+    return _Dataflow(
+        [
+            _Node(step, getattr(story, step, None), declaration)
+            for step, declaration in zip(executor.steps, executor.declarations)
+        ]
+    )
+
+
+class _Dataflow:
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.steps = [node.name for node in nodes]
+
+    def __getitem__(self, step):
+        return self.nodes[self.steps.index(step)]
+
+    @property
+    def inputs(self):
+        return _inputs(self.nodes)
+
+    @property
+    def outputs(self):
+        return _outputs(self.nodes)
+
+    @property
+    def edges(self):
+        return [
+            (before.name, after.name)
+            for index, after in enumerate(self.nodes)
+            for before in self.nodes[:index]
+            if _depends(before, after)
+        ]
+
+    def check(self, state_class):
+        validators = state_class.__init__.validators
+        arguments = state_class.__init__.arguments
+        assigned = set(arguments)
+        errors = []
+        for node in self.nodes:
+            if node.reads is None:
+                break
+            errors.extend(_check_node(node, validators, assigned))
+            assigned.update(node.writes)
+        return errors
+
+
+class _Node:
+    def __init__(self, name, step, declaration):
+        self.name = name
+        self.reads, self.writes = _effects(step, declaration)
+
+    def __repr__(self):
+        return (
+            f"{self.name}(reads={_sorted(self.reads)}, writes={_sorted(self.writes)})"
+        )
+
+
+def _check_node(node, validators, assigned):
+    for name in sorted(node.reads):
+        if name not in validators:
+            yield f"{node.name} reads undeclared variable {name}"
+        elif name not in assigned:
+            yield f"{node.name} reads variable {name} before it is assigned"
+    for name in sorted(node.writes - set(validators)):
+        yield f"{node.name} assigns undeclared variable {name}"
+
+
+def _depends(before, after):
+    if before.reads is None or after.reads is None:
+        return True
+    return bool(
+        before.writes & after.reads
+        or before.reads & after.writes
+        or before.writes & after.writes
+    )
+
+
+def _inputs(nodes):
+    inputs, assigned = set(), set()
+    for node in nodes:
+        if node.reads is None:
+            return None
+        inputs.update(node.reads - assigned)
+        assigned.update(node.writes)
+    return frozenset(inputs)
+
+
+def _outputs(nodes):
+    if any(node.reads is None for node in nodes):
+        return None
+    return frozenset().union(*(node.writes for node in nodes))
+
+
+def _executor(story):
+    if isinstance(story, type):
+        return story.__call__
+    return type(story).__call__
+
+
+def _effects(step, declaration):
+    reads, writes = _declared(step, declaration)
+    if declaration.guard is None:
+        return reads, writes
+    guarded = _analyze(declaration.guard)[0]
+    if reads is None or guarded is None:
+        return None, None
+    return reads | guarded, writes
+
+
+def _declared(step, declaration):
+    if declaration.kind == "each":
+        reads = frozenset([declaration.collection, *declaration.reads])
+        return reads, frozenset([declaration.into])
+    return _analyze(step)
+
+
+def _analyze(step):
+    if _is_story(step):
+        graph = dataflow(step)
+        return graph.inputs, graph.outputs
+    function = getattr(step, "__func__", step)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return None, None
+    if code not in analyses:
+        analyses[code] = _parse(function)
+    return analyses[code]
+
+
+def _parse(function):
+    try:
+        definition = ast.parse(dedent(getsource(function))).body[0]
+    except (OSError, SyntaxError):
+        return None, None
+    if not isinstance(definition, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return None, None
+    if not definition.args.args:
+        return None, None
+    return _visit(definition)
+
+
+def _visit(definition):
+    visitor = _Visitor(definition.args.args[-1].arg)
+    for statement in definition.body:
+        visitor.visit(statement)
+    if visitor.escaped:
+        return None, None
+    return frozenset(visitor.reads), frozenset(visitor.writes)
+
+
+class _Visitor(ast.NodeVisitor):
+    def __init__(self, state):
+        self.state = state
+        self.reads = set()
+        self.writes = set()
+        self.escaped = False
+
+    def visit_Assign(self, node):
+        self.visit(node.value)
+        for target in node.targets:
+            self.visit(target)
+
+    def visit_AugAssign(self, node):
+        self._read(self._variable(node.target))
+        self.visit(node.value)
+        self.visit(node.target)
+
+    def visit_Attribute(self, node):
+        name = self._variable(node)
+        if name is None:
+            self.generic_visit(node)
+        elif name.startswith("__"):
+            self.escaped = True
+        else:
+            contexts[type(node.ctx)](self, name)
+
+    def visit_Call(self, node):
+        name = self._constant(node.args[:2])
+        if name is None or not _is_builtin(node, accessors):
+            self.generic_visit(node)
+            return
+        for argument in node.args[2:] + node.keywords:
+            self.visit(argument)
+        accessors[node.func.id](self, name)
+
+    def visit_Name(self, node):
+        if node.id == self.state:
+            self.escaped = True
+
+    def _variable(self, node):
+        if isinstance(node, ast.Attribute) and self._is_state(node.value):
+            return node.attr
+
+    def _constant(self, arguments):
+        if len(arguments) == 2 and self._is_state(arguments[0]):
+            return _string(arguments[1])
+
+    def _is_state(self, node):
+        return isinstance(node, ast.Name) and node.id == self.state
+
+    def _read(self, name):
+        if name not in self.writes:
+            self.reads.add(name)
+
+    def _write(self, name):
+        self.writes.add(name)
+
+    def _ignore(self, name):
+        pass
+
+
+def _string(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+
+
+def _is_builtin(node, names):
+    return isinstance(node.func, ast.Name) and node.func.id in names
+
+
+def _sorted(names):
+    if names is None:
+        return None
+    return sorted(names)
+
+
+contexts = {
+    ast.Load: _Visitor._read,
+    ast.Store: _Visitor._write,
+    ast.Del: _Visitor._ignore,
+}
+
+
+accessors = {
+    "getattr": _Visitor._read,
+    "hasattr": _Visitor._read,
+    "setattr": _Visitor._write,
+}
+
+
+analyses = {}
@@ -0,0 +1,75 @@
+from asyncio import ensure_future
+from asyncio import wait
+from contextvars import ContextVar
+from functools import partial
+from time import monotonic
+
+from _stories.batch.coroutine import _cancel
+from _stories.batch.pipeline import _stages
+from _stories.exceptions import DeadlineError
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+from _stories.execute import function
+from _stories.profile import _Unprofiled
+
+
+def deadline(story, timeout, profile=None):
+    """Execute steps of the coroutine story within the time limit.
+
+    Every step is cancelled when the time limit runs out. Remaining time is
+    available to steps with remaining function. If profile is given, step which
+    average latency does not fit into the remaining time would not be started.
+
+    """
+    if not _is_coroutine(story.__call__):
+        raise StoryError("deadline can execute coroutine stories only")
+    return partial(_execute, _stages(story, True), timeout, profile or _Unprofiled())
+
+
+def remaining():
+    """Return seconds left before the deadline of the current story call."""
+    expires = expiration.get()
+    if expires is None:
+        return None
+    return max(expires - monotonic(), 0.0)
+
+
+async def _execute(stages, timeout, profile, state):
+    expires = _expires(timeout)
+    token = expiration.set(expires)
+    try:
+        for stage in stages:
+            await _run(stage, expires, profile, state)
+    finally:
+        expiration.reset(token)
+
+
+def _expires(timeout):
+    expires = monotonic() + timeout
+    outer = expiration.get()
+    if outer is not None:
+        return min(expires, outer)
+    return expires
+
+
+async def _run(stage, expires, profile, state):
+    if not function._admits(stage.declaration, state):
+        return
+    key = getattr(stage.method, "__qualname__", None)
+    name = getattr(stage.method, "__name__", repr(stage.method))
+    start = monotonic()
+    if expires - start <= profile.estimate(key):
+        raise DeadlineError(name)
+    task = ensure_future(stage(state))
+    try:
+        await wait({task}, timeout=expires - start)
+    finally:
+        await _cancel([task])
+    if task.cancelled():
+        raise DeadlineError(name)
+    task.result()
+    if key is not None:
+        profile.record(key, monotonic() - start)
+
+
+expiration = ContextVar("expiration", default=None)
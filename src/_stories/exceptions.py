@@ -8,3 +8,14 @@ class StateError(StoryError):
     """Incorrect state usage."""
 
     pass
+
+
+class DeadlineError(StoryError):
+    """Step could not finish before the deadline."""
+
+    def __init__(self, step):
+        super().__init__(step)
+        self.step = step
+
+    def __str__(self):
+        return f"{self.step} step could not finish before the deadline"
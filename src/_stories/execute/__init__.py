@@ -4,22 +4,110 @@ from types import MethodType
 
 from _stories.execute import coroutine
 from _stories.execute import function
+from _stories.execute import process
 
 
 class _Executor:
-    def __init__(self, steps):
+    def __init__(self, steps, declarations, namespace):
         self.steps = steps
+        self.declarations = declarations
+        self.function = function._compile(steps, declarations)
+        self.coroutines = {}
+        predictions = map(partial(_predict, namespace), steps, declarations)
+        self._coroutine(tuple(predictions))
 
     def __get__(self, instance, klass):
         if instance is None:
             return self
-        first_step = getattr(instance, self.steps[0])
-        if isinstance(first_step, MethodType):
-            step = first_step.__func__
-        else:
-            step = first_step.__call__.func
-        if iscoroutinefunction(step):
-            func = coroutine._execute
+        namespace = instance.__dict__
+        binding = namespace.get("__stories__", _unbound)
+        if binding.instance is not instance or _changed(binding):
+            binding = _Binding(instance, self._bind(instance))
+            namespace["__stories__"] = binding
+            binding.watched = _watch(instance)
+        return binding.method
+
+    def _bind(self, instance):
+        methods = [getattr(instance, step) for step in self.steps]
+        for method, declaration in zip(methods, self.declarations):
+            process._check(instance, method, declaration)
+        awaits = tuple(map(_awaitable, methods))
+        if any(awaits):
+            func = self._coroutine(awaits)
         else:
-            func = function._execute
-        return partial(func, self.steps, instance)
+            func = self.function
+        return MethodType(func, instance)
+
+    def _coroutine(self, awaits):
+        if awaits not in self.coroutines:
+            compiled = coroutine._compile(self.steps, self.declarations, awaits)
+            self.coroutines[awaits] = compiled
+        return self.coroutines[awaits]
+
+
+class _Binding:
+    def __init__(self, instance, method):
+        self.instance = instance
+        self.method = method
+        self.watched = []
+
+    def __reduce__(self):
+        return _Binding, (None, None)
+
+
+_unbound = _Binding(None, None)
+
+
+def _watch(story):
+    watched = []
+    stack = [story]
+    while stack:
+        story = stack.pop()
+        namespace = story.__dict__
+        namespace.setdefault("__stories__", _unbound)
+        steps = type(story).__call__.steps
+        names = [(step, namespace[step]) for step in steps if step in namespace]
+        watched.append((namespace, names, len(namespace)))
+        stack.extend(filter(_is_story, map(partial(getattr, story), steps)))
+    return watched
+
+
+def _changed(binding):
+    return any(
+        len(namespace) != size
+        or any(namespace.get(name) is not value for name, value in names)
+        for namespace, names, size in binding.watched
+    )
+
+
+def _is_coroutine(step):
+    return iscoroutinefunction(step) or iscoroutinefunction(step.__call__)
+
+
+def _is_story(step):
+    return isinstance(getattr(type(step), "__call__", None), _Executor)
+
+
+def _predict(namespace, step, declaration):
+    if callable(namespace.get(step)):
+        return _is_coroutine(namespace[step])
+    return declaration.kind not in coroutine.blocking
+
+
+def _awaitable(step):
+    if _is_story(step):
+        return _has_coroutines(step)
+    return _is_coroutine(step)
+
+
+def _has_coroutines(story):
+    stack = [story]
+    while stack:
+        story = stack.pop()
+        for step in type(story).__call__.steps:
+            method = getattr(story, step)
+            if _is_story(method):
+                stack.append(method)
+            elif _is_coroutine(method):
+                return True
+    return False
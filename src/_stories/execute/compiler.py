@@ -0,0 +1,47 @@
+from _stories.execute import each
+from _stories.execute import hedge
+from _stories.execute import process
+from _stories.execute import thread
+
+
+def _build(definition, templates, kinds, declarations, calls, scope):
+    body = [
+        _line(templates, kind, call, index, declarations[index])
+        for index, (kind, call) in enumerate(zip(kinds, calls))
+    ] or ["pass"]
+    scope.update(
+        {
+            "process": process,
+            "thread": thread,
+            "hedge": hedge,
+            "each": each,
+            "declarations": declarations,
+        }
+    )
+    exec("\n    ".join([definition, *body]), scope)  # nosec
+    return scope["_execute"]
+
+
+def _line(templates, kind, call, index, declaration):
+    line = templates[kind].format(call, index=index)
+    if declaration.bulkhead is not None:
+        line = _wrap(templates["limit"], line, index)
+    if declaration.guard is not None:
+        line = _wrap(guard, line, index)
+    return line
+
+
+def _wrap(template, line, index):
+    return template.format(line.replace("\n", "\n    "), index=index)
+
+
+guard = "if declarations[{index}].guard(state):\n        {}"
+
+
+def _attributes(steps):
+    return [f"story.{step}" for step in steps], {}
+
+
+def _globals(methods):
+    names = [f"step{index}" for index in range(len(methods))]
+    return names, dict(zip(names, methods))
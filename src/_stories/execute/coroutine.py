@@ -1,4 +1,78 @@
-async def _execute(steps, story, state):
-    for step in steps:
-        method = getattr(story, step)
-        await method(state)
+from _stories.execute import each
+from _stories.execute import function
+from _stories.execute import hedge
+from _stories.execute import process
+from _stories.execute import thread
+from _stories.execute.compiler import _attributes
+from _stories.execute.compiler import _build
+from _stories.execute.compiler import _globals
+from _stories.exceptions import StoryError
+
+
+def _compile(steps, declarations, awaits):
+    definition = "async def _execute(story, state):"
+    kinds = _kinds(declarations, awaits)
+    return _build(definition, templates, kinds, declarations, *_attributes(steps))
+
+
+def _compile_plan(methods, declarations, awaits):
+    definition = "async def _execute(state):"
+    kinds = _kinds(declarations, awaits)
+    return _build(definition, templates, kinds, declarations, *_globals(methods))
+
+
+def _kinds(declarations, awaits):
+    return [_kind(*pair) for pair in zip(declarations, awaits)]
+
+
+def _kind(declaration, awaitable):
+    if awaitable and declaration.kind in blocking:
+        message = f"Coroutine step can not be declared {declaration.kind}"
+        raise StoryError(message)
+    if awaitable:
+        return declaration.kind
+    return synchronous.get(declaration.kind, declaration.kind)
+
+
+async def _call(method, state, declaration):
+    await method(state)
+
+
+async def _inline(method, state, declaration):
+    method(state)
+
+
+async def _invoke(kind, method, state, declaration):
+    if not function._admits(declaration, state):
+        return
+    async with declaration.bulkhead or function.unlimited:
+        await calls[kind](method, state, declaration)
+
+
+templates = {
+    "call": "await {}(state)",
+    "process": "await process._coroutine({}, state, declarations[{index}])",
+    "inline": "{}(state)",
+    "blocking": "await thread._coroutine({}, state, declarations[{index}])",
+    "hedge": "await hedge._coroutine({}, state, declarations[{index}])",
+    "each": "await each._coroutine({}, state, declarations[{index}])",
+    "each_blocking": "await each._blocking({}, state, declarations[{index}])",
+    "limit": "async with declarations[{index}].bulkhead:\n        {}",
+}
+
+
+calls = {
+    "call": _call,
+    "process": process._coroutine,
+    "inline": _inline,
+    "blocking": thread._coroutine,
+    "hedge": hedge._coroutine,
+    "each": each._coroutine,
+    "each_blocking": each._blocking,
+}
+
+
+synchronous = {"call": "inline", "hedge": "inline", "each": "each_blocking"}
+
+
+blocking = {"inline", "blocking"}
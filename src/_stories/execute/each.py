@@ -0,0 +1,53 @@
+from asyncio import ensure_future
+from asyncio import gather
+from asyncio import get_running_loop
+from asyncio import Semaphore
+from concurrent.futures import FIRST_EXCEPTION
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import partial
+
+from _stories.state import State
+
+
+def _function(method, state, declaration):
+    states = _states(state, declaration)
+    with ThreadPoolExecutor(declaration.workers) as pool:
+        futures = [pool.submit(method, item) for item in states]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            future.cancel()
+    for future in futures:
+        future.result()
+    setattr(state, declaration.into, states)
+
+
+async def _coroutine(method, state, declaration):
+    states = _states(state, declaration)
+    semaphore = Semaphore(declaration.workers)
+    tasks = [ensure_future(_limit(semaphore, method, item)) for item in states]
+    try:
+        await gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+    setattr(state, declaration.into, states)
+
+
+async def _blocking(method, state, declaration):
+    run = partial(_function, method, state, declaration)
+    await get_running_loop().run_in_executor(None, run)
+
+
+async def _limit(semaphore, method, state):
+    async with semaphore:
+        await method(state)
+
+
+def _states(state, declaration):
+    variables = {name: getattr(state, name) for name in declaration.reads}
+    return [
+        State(**{**variables, declaration.item: element})
+        for element in getattr(state, declaration.collection)
+    ]
@@ -1,4 +1,74 @@
-def _execute(steps, story, state):
-    for step in steps:
-        method = getattr(story, step)
-        method(state)
+from _stories.execute import each
+from _stories.execute import process
+from _stories.execute.compiler import _attributes
+from _stories.execute.compiler import _build
+from _stories.execute.compiler import _globals
+
+
+def _compile(steps, declarations):
+    definition = "def _execute(story, state):"
+    kinds = _kinds(declarations)
+    return _build(definition, templates, kinds, declarations, *_attributes(steps))
+
+
+def _compile_plan(methods, declarations):
+    definition = "def _execute(state):"
+    kinds = _kinds(declarations)
+    return _build(definition, templates, kinds, declarations, *_globals(methods))
+
+
+def _kinds(declarations):
+    return [declaration.kind for declaration in declarations]
+
+
+def _call(method, state, declaration):
+    method(state)
+
+
+def _invoke(kind, method, state, declaration):
+    if not _admits(declaration, state):
+        return
+    with declaration.bulkhead or unlimited:
+        calls[kind](method, state, declaration)
+
+
+def _admits(declaration, state):
+    return declaration.guard is None or declaration.guard(state)
+
+
+class _Unlimited:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+templates = {
+    "call": "{}(state)",
+    "process": "process._function({}, state, declarations[{index}])",
+    "inline": "{}(state)",
+    "blocking": "{}(state)",
+    "hedge": "{}(state)",
+    "each": "each._function({}, state, declarations[{index}])",
+    "limit": "with declarations[{index}].bulkhead:\n        {}",
+}
+
+
+calls = {
+    "call": _call,
+    "process": process._function,
+    "inline": _call,
+    "blocking": _call,
+    "hedge": _call,
+    "each": each._function,
+}
+
+
+unlimited = _Unlimited()
@@ -0,0 +1,41 @@
+from asyncio import ensure_future
+from asyncio import FIRST_COMPLETED
+from asyncio import gather
+from asyncio import wait
+from time import perf_counter
+
+
+async def _coroutine(method, state, declaration):
+    hedge = declaration.hedging
+    start = perf_counter()
+    attempts = [ensure_future(method(state))]
+    try:
+        done, _ = await wait(attempts, timeout=hedge.delay())
+        if not done:
+            attempts.append(ensure_future(method(state)))
+        winner = await _first(attempts)
+    finally:
+        for attempt in attempts:
+            attempt.cancel()
+        await gather(*attempts, return_exceptions=True)
+    _record(hedge, perf_counter() - start, len(attempts), attempts.index(winner))
+    winner.result()
+
+
+async def _first(attempts):
+    pending = attempts
+    while pending:
+        done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+        succeeded = [attempt for attempt in done if attempt.exception() is None]
+        if succeeded:
+            return min(succeeded, key=attempts.index)
+    return attempts[0]
+
+
+def _record(hedge, latency, attempts, winner):
+    if winner:
+        latency = max([latency, *hedge.latencies])
+    hedge.latencies.append(latency)
+    hedge.calls += 1
+    hedge.hedged += attempts - 1
+    hedge.won += winner
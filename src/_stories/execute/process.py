@@ -0,0 +1,55 @@
+from asyncio import wrap_future
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from types import SimpleNamespace
+
+from _stories.exceptions import StoryError
+
+
+def _function(method, state, declaration):
+    changes = _submit(method, state, declaration).result()
+    _merge(state, changes)
+
+
+async def _coroutine(method, state, declaration):
+    changes = await wrap_future(_submit(method, state, declaration))
+    _merge(state, changes)
+
+
+def _submit(method, state, declaration):
+    variables = {name: getattr(state, name) for name in declaration.reads}
+    return _pool().submit(_run, method, variables)
+
+
+def _check(story, method, declaration):
+    if declaration.kind == "process" and getattr(method, "__self__", None) is story:
+        raise StoryError("Process step can not be a method of the story")
+
+
+def _run(method, variables):
+    snapshot = SimpleNamespace(**variables)
+    method(snapshot)
+    return {
+        name: value
+        for name, value in vars(snapshot).items()
+        if name not in variables or value is not variables[name]
+    }
+
+
+def _merge(state, changes):
+    for name, value in changes.items():
+        setattr(state, name, value)
+
+
+def _pool():
+    with lock:
+        if not pools:
+            pools.append(ProcessPoolExecutor(mp_context=get_context("spawn")))
+    return pools[0]
+
+
+lock = Lock()
+
+
+pools = []
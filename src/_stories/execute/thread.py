@@ -0,0 +1,5 @@
+from asyncio import get_running_loop
+
+
+async def _coroutine(method, state, declaration):
+    await get_running_loop().run_in_executor(None, method, state)
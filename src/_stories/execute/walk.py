@@ -0,0 +1,34 @@
+from _stories.execute import _is_story
+from _stories.execute import process
+
+
+def _walk(story):
+    stack = [_resolve(story)]
+    while stack:
+        step = next(stack[-1], _end)
+        if step is _end:
+            stack.pop()
+        elif _is_story(step[0]) and _expands(step[1]):
+            stack.append(_resolve(step[0]))
+        else:
+            yield step
+
+
+def _expands(declaration):
+    return (
+        declaration.kind == "call"
+        and declaration.bulkhead is None
+        and declaration.guard is None
+        and not declaration.barrier
+    )
+
+
+def _resolve(story):
+    executor = type(story).__call__
+    for step, declaration in zip(executor.steps, executor.declarations):
+        method = getattr(story, step)
+        process._check(story, method, declaration)
+        yield method, declaration
+
+
+_end = object()
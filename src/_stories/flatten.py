@@ -0,0 +1,16 @@
+from _stories.execute import _is_coroutine
+from _stories.execute import coroutine
+from _stories.execute import function
+from _stories.execute.walk import _walk
+
+
+def flatten(story):
+    """Resolve nested stories once and execute all their steps in a flat sequence."""
+    plan = list(_walk(story))
+    methods = [method for method, declaration in plan]
+    declarations = [declaration for method, declaration in plan]
+    if _is_coroutine(story.__call__):
+        awaits = [_is_coroutine(method) for method in methods]
+        return coroutine._compile_plan(methods, declarations, awaits)
+    else:
+        return function._compile_plan(methods, declarations)
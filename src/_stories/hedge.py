@@ -0,0 +1,47 @@
+from collections import deque
+
+from _stories.dataflow import _executor
+
+
+def hedges(story):
+    """Find hedged steps of the story and their statistics.
+
+    Story class or story instance could be given. Statistics are shared by all
+    calls of the story in the process.
+
+    """
+    executor = _executor(story)
+    return {
+        step: declaration.hedging
+        for step, declaration in zip(executor.steps, executor.declarations)
+        if declaration.kind == "hedge"
+    }
+
+
+class _Hedge:
+    def __init__(self, percentile):
+        self.percentile = percentile
+        self.latencies = deque(maxlen=100)
+        self.calls = 0
+        self.hedged = 0
+        self.won = 0
+
+    def __repr__(self):
+        return (
+            f"Hedge(percentile={self.percentile}, calls={self.calls}, "
+            f"hedged={self.hedged}, won={self.won})"
+        )
+
+    @property
+    def hedge_rate(self):
+        return self.hedged / self.calls if self.calls else 0.0
+
+    @property
+    def win_rate(self):
+        return self.won / self.hedged if self.hedged else 0.0
+
+    def delay(self):
+        if len(self.latencies) < 10:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[int(self.percentile * (len(latencies) - 1))]
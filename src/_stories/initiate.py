@@ -10,9 +10,12 @@ def initiate(cls):
     _check_bases(cls)
     _check_steps(cls)
     _check_init(cls)
-    return make_dataclass(
+    story = make_dataclass(
         cls.__name__, cls.__call__.steps, namespace={"__call__": cls.__call__}
     )
+    story.__module__ = cls.__module__
+    story.__qualname__ = cls.__qualname__
+    return story
 
 
 def _check_bases(cls):
@@ -0,0 +1,49 @@
+class AdaptiveLimit:
+    """Concurrency limit adjusted by latency and failures of story calls.
+
+    Limit grows by one after every limit calls finished in time. Limit shrinks
+    by backoff factor when call fails or takes longer than tolerance times the
+    baseline latency. Baseline follows the smallest latency observed and drifts
+    slowly towards slower calls.
+
+    """
+
+    def __init__(self, initial=10, minimum=1, maximum=1000, backoff=0.9, tolerance=2.0):
+        self.current = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.drift = 0.01
+        self.weight = 0.1
+        self.baseline = None
+        self.latency = None
+        self.calls = 0
+        self.errors = 0
+
+    @property
+    def limit(self):
+        """Number of story calls which could be in progress."""
+        return int(self.current)
+
+    def record(self, latency, failed=False):
+        """Adjust the limit to the finished story call."""
+        self.calls += 1
+        self.errors += failed
+        self.latency = _average(self.latency, latency, self.weight)
+        self.baseline = min(_average(self.baseline, latency, self.drift), latency)
+        if failed or latency > self.tolerance * self.baseline:
+            self.current = max(self.minimum, self.current * self.backoff)
+        else:
+            self.current = min(self.maximum, self.current + 1 / self.current)
+
+
+class _Fixed:
+    def __init__(self, limit):
+        self.limit = limit
+
+
+def _average(average, value, weight):
+    if average is None:
+        return value
+    return average + weight * (value - average)
@@ -0,0 +1,167 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from _stories.dataflow import _effects
+from _stories.exceptions import StateError
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+from _stories.execute import function
+from _stories.execute.walk import _walk
+from _stories.state import _setter
+from _stories.state import unknown_variable_template
+
+
+def optimistic(story, workers):
+    """Execute adjacent steps of the story speculatively in a pool of threads.
+
+    Every step of the group works with its own view of the state. Assignments
+    are applied to the state in the order of steps. If step read a variable
+    assigned by an earlier step of the group, the rest of the group would be
+    executed again one by one. Threads are started on the first call and
+    stopped when returned function is closed.
+
+    """
+    if _is_coroutine(story.__call__):
+        raise StoryError("optimistic can not execute coroutine stories")
+    return _Optimistic(_groups(_walk(story), workers), workers)
+
+
+class _Optimistic:
+    def __init__(self, groups, workers):
+        self.groups = groups
+        self.workers = workers
+        self.executor = None
+        self.lock = Lock()
+
+    def __call__(self, state):
+        for group in self.groups:
+            runs[len(group) > 1](group, self, state)
+
+    def close(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _start(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers)
+            return self.executor
+
+
+def _groups(steps, workers):
+    groups = [[]]
+    for method, declaration in steps:
+        step = _Step(method, declaration)
+        if not _fits(groups[-1], step, workers):
+            groups.append([])
+        groups[-1].append(step)
+    return [group for group in groups if group]
+
+
+class _Step:
+    def __init__(self, method, declaration):
+        self.method = method
+        self.declaration = declaration
+        self.reads, self.writes = _effects(method, declaration)
+
+    def __call__(self, state):
+        function._invoke(self.declaration.kind, self.method, state, self.declaration)
+
+
+def _fits(group, step, workers):
+    return len(group) < workers and not any(
+        _separates(before, step) for before in group
+    )
+
+
+def _separates(before, after):
+    return (
+        before.declaration.barrier
+        or after.declaration.barrier
+        or _conflicts(before, after)
+    )
+
+
+def _conflicts(before, after):
+    if before.writes is None or after.reads is None:
+        return False
+    return bool(before.writes & after.reads)
+
+
+def _run_one(group, runner, state):
+    group[0](state)
+
+
+def _run_group(group, runner, state):
+    records = [_Record(state) for _ in group]
+    executor = runner._start()
+    futures = [
+        executor.submit(step, _View(record)) for step, record in zip(group, records)
+    ]
+    assigned = set()
+    for index, record in enumerate(records):
+        if not _commit(record, futures[index], assigned):
+            _run_again(group[index:], state)
+            return
+
+
+def _commit(record, future, assigned):
+    error = future.exception()
+    if record.reads & assigned:
+        return False
+    if error is not None:
+        raise error
+    record.commit()
+    assigned.update(record.writes)
+    return True
+
+
+def _run_again(steps, state):
+    for step in steps:
+        step(state)
+
+
+class _Record:
+    def __init__(self, state):
+        self.state = state
+        self.reads = set()
+        self.writes = {}
+        self.validators = getattr(type(state).__init__, "validators", None)
+
+    def validate(self, name, value):
+        if self.validators is None:
+            return value
+        if name not in self.validators:
+            message = unknown_variable_template.format(variable=name, state=self.state)
+            raise StateError(message)
+        return self.validators[name](value)
+
+    def commit(self):
+        for name, value in self.writes.items():
+            _setter(self.state, name, value)
+
+
+class _View:
+    def __init__(self, record):
+        object.__setattr__(self, "_View__record", record)
+
+    def __getattr__(self, name):
+        self.__record.reads.add(name)
+        return getattr(self.__record.state, name)
+
+    def __setattr__(self, name, value):
+        record = self.__record
+        value = record.validate(name, value)
+        record.writes[name] = value
+        object.__setattr__(self, name, value)
+
+
+runs = {True: _run_group, False: _run_one}
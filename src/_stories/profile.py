@@ -0,0 +1,35 @@
+class Profile:
+    """Moving average of step latencies observed by concurrent stories.
+
+    Latencies are kept in seconds under qualified names of step methods.
+    Exported latencies could be given to the profile of another process.
+
+    """
+
+    def __init__(self, latencies=None, weight=0.2):
+        self.latencies = dict(latencies or {})
+        self.weight = weight
+
+    def export(self):
+        """Return latencies of known steps."""
+        return dict(self.latencies)
+
+    def estimate(self, step):
+        """Return expected latency of the step."""
+        return self.latencies.get(step, 0.0)
+
+    def record(self, step, latency):
+        """Move expected latency of the step towards observed one."""
+        if step in self.latencies:
+            latency = self.latencies[step] + self.weight * (
+                latency - self.latencies[step]
+            )
+        self.latencies[step] = latency
+
+
+class _Unprofiled:
+    def estimate(self, step):
+        return 0.0
+
+    def record(self, step, latency):
+        pass
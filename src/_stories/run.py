@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from _stories.batch import coroutine
+from _stories.batch import function
+from _stories.batch import pipeline
+from _stories.batch import pool
+from _stories.batch import process
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+from _stories.execute import _is_story
+from _stories.limit import _Fixed
+from _stories.limit import AdaptiveLimit
+
+
+def run_many(story, states, collect=False):
+    """Execute story with every state of the iterable one by one.
+
+    Steps of the story are resolved once for the whole batch.
+
+    """
+    execute = _bind(story)
+    module = coroutine if _is_coroutine(execute) else function
+    if collect:
+        return module._collect_many(execute, states)
+    else:
+        return module._run_many(execute, states)
+
+
+def run_concurrently(story, states, limit, ordered=True, collect=False):
+    """Execute coroutine story with states of the iterable concurrently.
+
+    No more than limit story calls would be in progress at the same time. Limit
+    could be a number or an AdaptiveLimit object. States could be given as a
+    regular or an asynchronous iterable.
+
+    """
+    execute = _bind(story)
+    if not _is_coroutine(execute):
+        raise StoryError("run_concurrently can execute coroutine stories only")
+    if isinstance(limit, AdaptiveLimit):
+        execute = partial(coroutine._measure, execute, limit)
+    else:
+        limit = _Fixed(limit)
+    return coroutine._run_concurrently(execute, states, limit, ordered, collect)
+
+
+def run_threads(story, states, workers, chunksize=1, ordered=True, collect=False):
+    """Execute story with states of the iterable in a pool of threads.
+
+    States are sent to threads in chunks of the given size. Results are given
+    in the same order as states unless ordered is false.
+
+    """
+    execute = _bind(story)
+    if _is_coroutine(execute):
+        raise StoryError("run_threads can not execute coroutine stories")
+    executor = ThreadPoolExecutor(workers)
+    run_chunk = partial(function._run_chunk, execute, collect)
+    return pool._run_pool(executor, 2 * workers, run_chunk, states, chunksize, ordered)
+
+
+def run_processes(story, states, workers, chunksize=1, ordered=True, collect=False):
+    """Execute story with states of the iterable in a pool of processes.
+
+    Story is sent to every process once. States are sent to processes in chunks
+    of the given size. Story, states and exceptions should be picklable. Results
+    are copies of states made by processes.
+
+    """
+    if _is_coroutine(_bind(story)):
+        raise StoryError("run_processes can not execute coroutine stories")
+    executor = ProcessPoolExecutor(
+        workers, initializer=process._initialize, initargs=(story,)
+    )
+    run_chunk = partial(process._run_chunk, collect)
+    return pool._run_pool(executor, 2 * workers, run_chunk, states, chunksize, ordered)
+
+
+def run_pipeline(story, states, workers, ordered=True, collect=False):
+    """Execute every step of the story as a stage of the pipeline.
+
+    Steps of nested stories are resolved once. Every stage takes states from a
+    bounded queue filled by the previous stage. Stages of synchronous stories
+    are served by threads, stages of coroutine stories are served by tasks.
+    Workers could be a number for every stage or a list of numbers for each.
+
+    """
+    awaitable = _is_coroutine(story.__call__)
+    stages = pipeline._stages(story, awaitable)
+    workers = _workers(workers, stages)
+    run = pipelines[awaitable]
+    return run(stages, workers, states, ordered, collect)
+
+
+def _workers(workers, stages):
+    if isinstance(workers, int):
+        return [workers] * len(stages)
+    if len(workers) != len(stages):
+        message = f"run_pipeline expects workers for {len(stages)} steps"
+        raise StoryError(message)
+    return list(workers)
+
+
+def _bind(story):
+    if _is_story(story):
+        return story.__call__
+    else:
+        return story
+
+
+pipelines = {True: pipeline._run_tasks, False: pipeline._run_threads}
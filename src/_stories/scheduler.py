@@ -0,0 +1,86 @@
+from asyncio import CancelledError
+from asyncio import get_running_loop
+from collections import deque
+from functools import partial
+
+from _stories.batch.pipeline import _stages
+from _stories.exceptions import StoryError
+from _stories.execute import _is_coroutine
+
+
+class Scheduler:
+    """Execute coroutine stories step by step in order of their priority.
+
+    No more than limit steps would be in progress at the same time. Every step
+    of the story takes a free slot. When slot is released, it is given to the
+    waiting story with the smallest priority. Priority which was passed over
+    patience times in a row would take the next slot.
+
+    """
+
+    def __init__(self, limit, patience=8):
+        self.limit = limit
+        self.patience = patience
+        self.running = 0
+        self.queues = {}
+        self.bypassed = {}
+
+    def __call__(self, story, priority=0):
+        """Return coroutine function to execute the story with the state."""
+        if not _is_coroutine(story.__call__):
+            raise StoryError("Scheduler can execute coroutine stories only")
+        return partial(_execute, self, _stages(story, True), priority)
+
+    @property
+    def waiting(self):
+        """Number of stories waiting for a free slot."""
+        return sum(map(len, self.queues.values()))
+
+    async def _acquire(self, priority):
+        if self.running < self.limit and not self.waiting:
+            self.running += 1
+            return
+        future = get_running_loop().create_future()
+        self.queues.setdefault(priority, deque()).append(future)
+        self.bypassed.setdefault(priority, 0)
+        try:
+            await future
+        except CancelledError:
+            _abandon(self, priority, future)
+            raise
+
+    def _release(self):
+        while self.waiting:
+            future = self._choose().popleft()
+            if not future.cancelled():
+                future.set_result(None)
+                return
+        self.running -= 1
+
+    def _choose(self):
+        priorities = sorted(key for key, queue in self.queues.items() if queue)
+        chosen = next(filter(self._starving, priorities), priorities[0])
+        for key in priorities:
+            self.bypassed[key] += 1
+        self.bypassed[chosen] = 0
+        return self.queues[chosen]
+
+    def _starving(self, priority):
+        return self.bypassed[priority] >= self.patience
+
+
+def _abandon(scheduler, priority, future):
+    queue = scheduler.queues[priority]
+    if not future.cancelled():
+        scheduler._release()
+    elif future in queue:
+        queue.remove(future)
+
+
+async def _execute(scheduler, stages, priority, state):
+    for stage in stages:
+        await scheduler._acquire(priority)
+        try:
+            await stage(state)
+        finally:
+            scheduler._release()
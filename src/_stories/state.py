@@ -87,12 +87,17 @@ def _new_validate_state(namespace):
     return scope
 
 
+def _qualified_name(namespace):
+    return {k: v for k, v in namespace.items() if k in {"__module__", "__qualname__"}}
+
+
 class _StateType(type):
     def __new__(cls, class_name, bases, namespace):
         if bases:
             scope = _new_validate_state(namespace)
         else:
             scope = {"__init__": _initiator}
+        scope.update(_qualified_name(namespace))
         return type.__new__(cls, class_name, bases, scope)
 
     def __repr__(cls):
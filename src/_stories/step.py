@@ -1,6 +1,61 @@
+from _stories.bulkhead import _Bulkhead
+from _stories.hedge import _Hedge
+
+
 class _Step:
     def __init__(self):
         self.steps = []
+        self.declarations = []
 
     def __getattr__(self, name):
+        declaration = _Declaration()
         self.steps.append(name)
+        self.declarations.append(declaration)
+        return declaration
+
+
+class _Declaration:
+    def __init__(self):
+        self.kind = "call"
+        self.barrier = False
+        self.bulkhead = None
+        self.guard = None
+
+    def process(self, *reads):
+        self.kind = "process"
+        self.reads = reads
+        return self
+
+    def inline(self):
+        self.kind = "inline"
+        return self
+
+    def blocking(self):
+        self.kind = "blocking"
+        return self
+
+    def each(self, collection, item, into, *reads, workers=10):
+        self.kind = "each"
+        self.collection = collection
+        self.item = item
+        self.into = into
+        self.reads = reads
+        self.workers = workers
+        return self
+
+    def hedge(self, percentile=0.95):
+        self.kind = "hedge"
+        self.hedging = _Hedge(percentile)
+        return self
+
+    def ordered(self):
+        self.barrier = True
+        return self
+
+    def limit(self, limit):
+        self.bulkhead = _Bulkhead(limit)
+        return self
+
+    def when(self, predicate):
+        self.guard = predicate
+        return self
@@ -7,10 +7,10 @@ class _StoryType(type):
         return {"I": _Step()}
 
     def __new__(cls, class_name, bases, namespace):
-        steps = namespace.pop("I").steps
+        step = namespace.pop("I")
         if not bases:
             return type.__new__(cls, class_name, bases, namespace)
-        namespace["__call__"] = _Executor(steps)
+        namespace["__call__"] = _Executor(step.steps, step.declarations, namespace)
         return type.__new__(cls, class_name, bases, namespace)
 
 
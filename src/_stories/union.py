@@ -1,4 +1,7 @@
+from copyreg import pickle
+
 from _stories.argument import Argument
+from _stories.state import _StateType
 from _stories.state import State
 from _stories.variable import Variable
 
@@ -10,7 +13,17 @@ def Union(*states):
 
     Validators for repeated variables and arguments would be combined as well.
 
+    Union of the same states would be the same class.
+
     """
+    if states not in unions:
+        union = _new_union(states)
+        unions[states] = union
+        reductions[union] = (Union, states)
+    return unions[states]
+
+
+def _new_union(states):
     class_name = "Union(" + ", ".join(state.__name__ for state in states) + ")"
     scope = {
         name: lookup[is_argument](_Merge(validators))
@@ -19,6 +32,10 @@ def Union(*states):
     return type(class_name, (State,), scope)
 
 
+def _reduce(state_class):
+    return reductions.get(state_class, state_class.__qualname__)
+
+
 class _Merge:
     def __new__(cls, validators):
         if len(validators) > 1:
@@ -55,3 +72,12 @@ def _set(new, name, is_argument, validator):
 
 
 lookup = {True: Argument, False: Variable}
+
+
+unions = {}
+
+
+reductions = {}
+
+
+pickle(_StateType, _reduce)
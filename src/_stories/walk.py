@@ -0,0 +1,25 @@
+from functools import partial
+
+from _stories.execute import _is_coroutine
+from _stories.execute import coroutine
+from _stories.execute import function
+from _stories.execute.walk import _walk
+
+
+def walk(story):
+    """Execute steps of nested stories one by one without nested calls."""
+    if _is_coroutine(story.__call__):
+        return partial(_coroutine, story)
+    else:
+        return partial(_function, story)
+
+
+def _function(story, state):
+    for method, declaration in _walk(story):
+        function._invoke(declaration.kind, method, state, declaration)
+
+
+async def _coroutine(story, state):
+    for method, declaration in _walk(story):
+        kind = coroutine._kind(declaration, _is_coroutine(method))
+        await coroutine._invoke(kind, method, state, declaration)
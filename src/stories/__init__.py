@@ -1,12 +1,57 @@
 """Service objects designed with OOP in mind."""
 from _stories.actor import Actor
 from _stories.argument import Argument
+from _stories.bridge import Bridge
+from _stories.bulkhead import bulkheads
+from _stories.concurrent import concurrent
+from _stories.dataflow import dataflow
+from _stories.deadline import deadline
+from _stories.deadline import remaining
+from _stories.flatten import flatten
+from _stories.hedge import hedges
 from _stories.initiate import initiate
+from _stories.limit import AdaptiveLimit
+from _stories.optimistic import optimistic
+from _stories.profile import Profile
+from _stories.run import run_concurrently
+from _stories.run import run_many
+from _stories.run import run_pipeline
+from _stories.run import run_processes
+from _stories.run import run_threads
+from _stories.scheduler import Scheduler
 from _stories.state import State
 from _stories.story import Story
 from _stories.stubs import I
 from _stories.union import Union
 from _stories.variable import Variable
+from _stories.walk import walk
 
 
-__all__ = ("Story", "I", "initiate", "State", "Union", "Argument", "Variable", "Actor")
+__all__ = (
+    "Story",
+    "I",
+    "initiate",
+    "flatten",
+    "walk",
+    "concurrent",
+    "optimistic",
+    "deadline",
+    "remaining",
+    "dataflow",
+    "bulkheads",
+    "hedges",
+    "run_many",
+    "run_concurrently",
+    "run_threads",
+    "run_processes",
+    "run_pipeline",
+    "Bridge",
+    "Profile",
+    "Scheduler",
+    "AdaptiveLimit",
+    "State",
+    "Union",
+    "Argument",
+    "Variable",
+    "Actor",
+)
@@ -1,6 +1,7 @@
 """A set of stories' exceptions."""
+from _stories.exceptions import DeadlineError
 from _stories.exceptions import StateError
 from _stories.exceptions import StoryError
 
 
-__all__ = ("StoryError", "StateError")
+__all__ = ("StoryError", "StateError", "DeadlineError")
@@ -0,0 +1,3 @@
+def compute_quote(state):
+    """Perform heavy computation."""
+    state.quote = state.order.cost.amount * 2
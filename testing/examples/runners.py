@@ -6,24 +6,34 @@ import _stories.execute
 _stories.execute.instrumented = False
 
 
-origin_function = _stories.execute.function._execute
-origin_coroutine = _stories.execute.coroutine._execute
+origin_function = _stories.execute.function._compile
+origin_coroutine = _stories.execute.coroutine._compile
 
 
-def _instrumented_function(*args, **kwargs):
-    if not _stories.execute.instrumented:
-        raise Exception("Use 'r' fixture to run the story")  # pragma: no cover
-    return origin_function(*args, **kwargs)
+def _instrumented_function(steps, declarations):
+    execute = origin_function(steps, declarations)
 
+    def _execute(story, state):
+        if not _stories.execute.instrumented:
+            raise Exception("Use 'r' fixture to run the story")  # pragma: no cover
+        return execute(story, state)
 
-async def _instrumented_coroutine(*args, **kwargs):
-    if not _stories.execute.instrumented:
-        raise Exception("Use 'r' fixture to run the story")  # pragma: no cover
-    return await origin_coroutine(*args, **kwargs)
+    return _execute
 
 
-_stories.execute.function._execute = _instrumented_function
-_stories.execute.coroutine._execute = _instrumented_coroutine
+def _instrumented_coroutine(steps, declarations, awaits):
+    execute = origin_coroutine(steps, declarations, awaits)
+
+    async def _execute(story, state):
+        if not _stories.execute.instrumented:
+            raise Exception("Use 'r' fixture to run the story")  # pragma: no cover
+        return await execute(story, state)
+
+    return _execute
+
+
+_stories.execute.function._compile = _instrumented_function
+_stories.execute.coroutine._compile = _instrumented_coroutine
 
 
 class _Function:
@@ -34,6 +44,9 @@ class _Function:
         finally:
             _stories.execute.instrumented = False
 
+    def collect(self, iterable):
+        return self.run(list, iterable)
+
     def import_module(self, module_name):
         return importlib.import_module(module_name + ".functions")
 
@@ -50,8 +63,15 @@ class _Coroutine:
         finally:
             _stories.execute.instrumented = False
 
+    def collect(self, iterable):
+        return self.run(_list, iterable)
+
     def import_module(self, module_name):
         return importlib.import_module(module_name + ".coroutines")
 
 
+async def _list(iterable):
+    return [item async for item in iterable]
+
+
 runners = {"function": _Function(), "coroutine": _Coroutine()}
@@ -0,0 +1,99 @@
+"""Tests related to AdaptiveLimit class."""
+import asyncio
+
+from stories import AdaptiveLimit
+from stories import I
+from stories import run_concurrently
+from stories import State
+from stories import Story
+
+
+class _A1(Story):
+    I.a1s1
+
+    async def a1s1(self, state):
+        await self.backend.query()
+
+    def __init__(self, backend):
+        self.backend = backend
+
+
+class _Backend:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.active = 0
+        self.peak = 0
+
+    async def query(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            for _ in range(3):
+                await asyncio.sleep(0)
+            if self.active > self.capacity:
+                raise _OverloadError(self.active)
+        finally:
+            self.active -= 1
+
+
+class _OverloadError(Exception):
+    ...
+
+
+def test_additive_increase():
+    """Limit should grow by one after limit calls finished in time."""
+    limit = AdaptiveLimit(initial=2)
+    limits = []
+    for _ in range(6):
+        limit.record(1.0)
+        limits.append(limit.limit)
+    assert limits == [2, 2, 3, 3, 3, 4]
+    assert (limit.calls, limit.errors, limit.latency) == (6, 0, 1.0)
+
+
+def test_multiplicative_decrease():
+    """Limit should shrink after failed or slow call."""
+    limit = AdaptiveLimit(initial=10)
+    limit.record(1.0, failed=True)
+    assert (limit.limit, limit.errors) == (9, 1)
+    limit.record(3.0)
+    assert limit.limit == 8
+    assert limit.baseline == 1.02
+    assert limit.latency == 1.2
+
+
+def test_limit_bounds():
+    """Limit should stay between minimum and maximum."""
+    limit = AdaptiveLimit(initial=2, minimum=2, maximum=3)
+    limit.record(1.0, failed=True)
+    assert limit.limit == 2
+    for _ in range(10):
+        limit.record(1.0)
+    assert limit.limit == 3
+
+
+def test_baseline_drift():
+    """Baseline should drift towards slower calls."""
+    limit = AdaptiveLimit()
+    limit.record(1.0)
+    for _ in range(200):
+        limit.record(1.5)
+    assert 1.4 < limit.baseline < 1.5
+    assert limit.limit > 10
+
+
+def test_simulated_backend():
+    """Limit should converge to the capacity of the backend."""
+    backend = _Backend(capacity=8)
+    limit = AdaptiveLimit(initial=32, tolerance=float("inf"))
+    states = [State() for _ in range(400)]
+
+    async def collect():
+        results = run_concurrently(_A1(backend), states, limit, collect=True)
+        return [error async for state, error in results]
+
+    errors = asyncio.run(collect())
+    assert limit.errors == sum(error is not None for error in errors)
+    assert limit.calls == 400
+    assert 6 <= limit.limit <= 10
+    assert errors[-100:].count(None) > 80
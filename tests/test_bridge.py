@@ -0,0 +1,177 @@
+"""Tests related to Bridge class."""
+import asyncio
+from concurrent.futures import CancelledError
+from concurrent.futures import ThreadPoolExecutor
+from threading import current_thread
+from threading import Event
+from threading import get_ident
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from stories import Bridge
+from stories import flatten
+from stories import I
+from stories import State
+from stories import Story
+from stories import walk
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    async def a1s1(self, state):
+        await asyncio.sleep(0)
+        state.thread = get_ident()
+        state.loop = asyncio.get_running_loop()
+
+    async def a1s2(self, state):
+        if state.number < 0:
+            raise _StepError(state.number)
+        state.result = state.number * 2
+
+
+class _B1(Story):
+    I.b1s1
+
+    async def b1s1(self, state):
+        state.started.set()
+        await asyncio.sleep(60)
+
+
+class _C1(Story):
+    I.c1s1
+    I.c1s2
+
+    async def c1s1(self, state):
+        await asyncio.sleep(0)
+
+    def c1s2(self, state):
+        state.bridge(_A1(), State(number=1))
+
+
+class _D1(Story):
+    I.d1s1
+    I.d1s2.blocking()
+
+    async def d1s1(self, state):
+        await asyncio.sleep(0)
+
+    def d1s2(self, state):
+        state.thread = current_thread()
+        state.started.set()
+        sleep(0.1)
+
+
+class _StepError(Exception):
+    ...
+
+
+def _suppress(bridge, story, state):
+    try:
+        bridge(story, state)
+    except CancelledError:
+        ...
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_execute_story(wrap):
+    """Story should be executed on the same event loop in another thread."""
+    with Bridge() as bridge:
+        first, second = State(number=1), State(number=2)
+        bridge(wrap(_A1()), first)
+        bridge(wrap(_A1()), second)
+    assert (first.result, second.result) == (2, 4)
+    assert first.thread == second.thread != get_ident()
+    assert first.loop is second.loop
+    assert first.loop.is_closed()
+
+
+def test_propagate_exception():
+    """Exception raised by the story should be raised in the caller."""
+    with Bridge() as bridge:
+        with pytest.raises(_StepError) as exc_info:
+            bridge(_A1(), State(number=-1))
+    assert exc_info.value.args == (-1,)
+
+
+def test_many_threads():
+    """Bridge could be called from many threads at the same time."""
+    states = [State(number=number) for number in range(100)]
+    with Bridge() as bridge, ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda state: bridge(_A1(), state), states))
+    assert [state.result for state in states] == list(range(0, 200, 2))
+    assert len({state.thread for state in states}) == 1
+
+
+def test_close_cancels_stories():
+    """Stories in progress should be cancelled when bridge is closed."""
+    bridge = Bridge()
+    state = State(started=Event())
+    errors = []
+
+    def run():
+        try:
+            bridge(_B1(), state)
+        except CancelledError as error:
+            errors.append(error)
+
+    thread = Thread(target=run)
+    thread.start()
+    state.started.wait()
+    bridge.close()
+    thread.join()
+    assert len(errors) == 1
+    assert bridge.loop is None
+
+
+def test_close_stops_threads():
+    """Threads of blocking steps should be stopped when bridge is closed."""
+    bridge = Bridge()
+    state = State(started=Event())
+    thread = Thread(target=_suppress, args=(bridge, _D1(), state))
+    thread.start()
+    state.started.wait()
+    bridge.close()
+    thread.join()
+    assert not state.thread.is_alive()
+
+
+def test_restart_after_close():
+    """Closed bridge should start new event loop on the next call."""
+    bridge = Bridge()
+    bridge.close()
+    first, second = State(number=1), State(number=1)
+    bridge(_A1(), first)
+    bridge.close()
+    bridge(_A1(), second)
+    bridge.close()
+    assert first.loop is not second.loop
+
+
+def test_deny_own_loop():
+    """Deny to call bridge from the story executed by the same bridge."""
+    with Bridge() as bridge:
+        with pytest.raises(StoryError) as exc_info:
+            bridge(_C1(), State(bridge=bridge))
+    expected = "Bridge can not be called from its own event loop"
+    assert str(exc_info.value) == expected
+
+
+def test_deny_function_stories():
+    """Deny to execute function stories."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            raise RuntimeError
+
+    with Bridge() as bridge:
+        with pytest.raises(StoryError) as exc_info:
+            bridge(A1(), State())
+    expected = "Bridge can execute coroutine stories only"
+    assert str(exc_info.value) == expected
@@ -0,0 +1,170 @@
+"""Tests related to step concurrency limits."""
+import asyncio
+from threading import Barrier
+from threading import Lock
+from time import sleep
+
+import pytest
+
+from stories import bulkheads
+from stories import flatten
+from stories import I
+from stories import run_concurrently
+from stories import run_threads
+from stories import State
+from stories import Story
+from stories import walk
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2.limit(2)
+    I.a1s3
+
+    def a1s1(self, state):
+        self.barrier.wait()
+
+    def a1s2(self, state):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        sleep(0.01)
+        with self.lock:
+            self.active -= 1
+
+    def a1s3(self, state):
+        state.done = True
+
+    def __init__(self):
+        self.barrier = Barrier(4, timeout=5)
+        self.lock = Lock()
+        self.active = 0
+        self.peak = 0
+
+
+class _B1(Story):
+    I.b1s1
+    I.b1s2.limit(1)
+
+    async def b1s1(self, state):
+        await asyncio.sleep(0)
+
+    async def b1s2(self, state):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await state.event.wait()
+        state.cancel(state.victim)
+        self.active -= 1
+        state.done = True
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+
+class _D1(Story):
+    I.d1s1
+
+    def d1s1(self, state):
+        state.calls.append("d1s1")
+
+
+class _C1(Story):
+    I.c1s1
+    I.d1.limit(1)
+
+    def c1s1(self, state):
+        state.calls = ["c1s1"]
+
+    d1 = _D1()
+
+
+def test_limit_threads():
+    """Limited step should not be executed by more threads than limit."""
+    story = _A1()
+    states = [State() for _ in range(8)]
+    assert list(run_threads(story, states, 4)) == states
+    assert all(state.done for state in states)
+    assert story.peak == 2
+    bulkhead = bulkheads(story)["a1s2"]
+    assert (bulkhead.active, bulkhead.waiting) == (0, 0)
+    assert bulkhead.acquired >= 8
+    assert bulkhead.waited > 0
+
+
+def test_limit_tasks():
+    """Limited step should not be executed by more tasks than limit."""
+    story = _B1()
+    states = [State(victim=None, cancel=_ignore) for _ in range(6)]
+
+    async def collect():
+        for state in states:
+            state.event = asyncio.Event()
+            state.event.set()
+        return [state async for state in run_concurrently(story, states, 6)]
+
+    assert asyncio.run(collect()) == states
+    assert story.peak == 1
+    assert bulkheads(_B1)["b1s2"].active == 0
+
+
+def test_find_limits():
+    """Limits should be found for steps of story class or instance."""
+    assert list(bulkheads(_A1)) == ["a1s2"]
+    assert bulkheads(_A1()) == bulkheads(_A1)
+    assert repr(bulkheads(_A1)["a1s2"]).startswith("Bulkhead(limit=2, active=0")
+
+
+def _ignore(task):
+    pass
+
+
+def _cancel_now(task):
+    task.cancel()
+
+
+def _cancel_soon(task):
+    asyncio.get_running_loop().call_soon(task.cancel)
+
+
+def _cancel_later(task):
+    loop = asyncio.get_running_loop()
+    loop.call_soon(loop.call_soon, task.cancel)
+
+
+@pytest.mark.parametrize("cancel", [_cancel_now, _cancel_soon, _cancel_later])
+def test_cancel_waiting(cancel):
+    """Cancelled task should leave the queue or release given slot."""
+    story = _B1()
+
+    async def main():
+        first = State(event=asyncio.Event(), cancel=cancel)
+        second = State(event=asyncio.Event(), cancel=_ignore, victim=None)
+        third = State(event=asyncio.Event(), cancel=_ignore, victim=None)
+        tasks = [asyncio.create_task(story(state)) for state in [first, second]]
+        first.victim = tasks[1]
+        await asyncio.sleep(0.01)
+        waiting = asyncio.create_task(story(third))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        first.event.set()
+        third.event.set()
+        await asyncio.gather(*tasks, waiting, return_exceptions=True)
+        return first, tasks
+
+    first, tasks = asyncio.run(main())
+    assert first.done
+    assert tasks[1].cancelled()
+    bulkhead = bulkheads(_B1)["b1s2"]
+    assert (bulkhead.active, bulkhead.waiting) == (0, 0)
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_limit_nested_story(wrap):
+    """Limited nested story should enter its limit as a single step."""
+    bulkhead = bulkheads(_C1)["d1"]
+    acquired = bulkhead.acquired
+    state = State()
+    wrap(_C1())(state)
+    assert state.calls == ["c1s1", "d1s1"]
+    assert bulkhead.acquired == acquired + 1
@@ -0,0 +1,246 @@
+"""Tests related to concurrent function."""
+import asyncio
+from functools import partial
+
+import pytest
+
+from stories import concurrent
+from stories import I
+from stories import Profile
+from stories import State
+from stories import Story
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.find_order
+    I.find_customer
+    I.check_balance
+    I.persist_payment.ordered()
+    I.send_receipt
+
+    async def find_order(self, state):
+        self.log.append("find_order")
+        for _ in range(state.ticks):
+            await asyncio.sleep(0)
+        state.order = state.order_id * 10
+        self.log.append("order")
+
+    async def find_customer(self, state):
+        self.log.append("find_customer")
+        await asyncio.sleep(0)
+        if state.customer_id < 0:
+            raise _StepError(state.customer_id)
+        state.customer = state.customer_id * 10
+        self.log.append("customer")
+
+    def check_balance(self, state):
+        self.log.append("check_balance")
+        if state.order > state.customer:
+            raise _StepError(state.order)
+
+    async def persist_payment(self, state):
+        await asyncio.sleep(0)
+        self.log.append("persist_payment")
+
+    async def send_receipt(self, state):
+        self.log.append("send_receipt")
+
+    def __init__(self):
+        self.log = []
+
+
+class _B1(Story):
+    I.b1s1
+    I.a1
+    I.b1s2
+
+    async def b1s1(self, state):
+        self.a1.log.append("b1s1")
+
+    def b1s2(self, state):
+        self.a1.log.append("b1s2")
+        state.receipt = state.order
+
+    def __init__(self):
+        self.a1 = _A1()
+
+
+class _C1(Story):
+    I.compute
+    I.fetch
+    I.store
+
+    def compute(self, state):
+        state.log.append("compute")
+
+    async def fetch(self, state):
+        state.log.append("fetch")
+        await asyncio.sleep(0)
+        state.data = 1
+
+    async def store(self, state):
+        state.log.append("store")
+        state.stored = state.data
+
+
+class _D1(Story):
+    I.load
+    I.compute
+
+    async def load(self, state):
+        await asyncio.sleep(0)
+        state.price = 5
+
+    async def compute(self, state):
+        _total(state)
+
+
+class _StepError(Exception):
+    ...
+
+
+def _total(state):
+    state.total = state.price * 2
+
+
+def test_independent_steps():
+    """Steps without dependencies should be executed concurrently."""
+    story = _A1()
+    state = State(order_id=1, customer_id=2, ticks=3)
+    asyncio.run(concurrent(story)(state))
+    assert story.log == [
+        "find_order",
+        "find_customer",
+        "customer",
+        "order",
+        "check_balance",
+        "persist_payment",
+        "send_receipt",
+    ]
+
+
+def test_nested_stories():
+    """Steps of nested stories should be executed in the same graph."""
+    story = _B1()
+    state = State(order_id=1, customer_id=2, ticks=1)
+    asyncio.run(concurrent(story)(state))
+    assert story.a1.log == [
+        "b1s1",
+        "find_order",
+        "find_customer",
+        "order",
+        "customer",
+        "check_balance",
+        "persist_payment",
+        "send_receipt",
+        "b1s2",
+    ]
+    assert state.receipt == 10
+
+
+@pytest.mark.parametrize("customer_id", [-1, 0])
+def test_cancel_steps(customer_id):
+    """Failed step should cancel steps in progress and steps not started."""
+    story = _A1()
+    state = State(order_id=1, customer_id=customer_id, ticks=5)
+    with pytest.raises(_StepError):
+        asyncio.run(concurrent(story)(state))
+    assert "persist_payment" not in story.log
+
+
+def test_cancel_in_progress():
+    """Step in progress should be cancelled on failure of independent step."""
+    story = _A1()
+    state = State(order_id=1, customer_id=-1, ticks=5)
+    with pytest.raises(_StepError):
+        asyncio.run(concurrent(story)(state))
+    assert story.log == ["find_order", "find_customer"]
+
+
+def test_unknown_steps():
+    """Steps without source code should wait for all earlier steps."""
+
+    class C1(Story):
+        I.c1s1
+        I.c1s2
+        I.c1s3
+
+        async def c1s1(self, state):
+            await asyncio.sleep(0)
+            state.calls.append("c1s1")
+
+        async def c1s3(self, state):
+            state.calls.append("c1s3")
+
+        def __init__(self, c1s2):
+            self.c1s2 = c1s2
+
+    async def append(name, state):
+        state.calls.append(name)
+
+    state = State(calls=[])
+    profile = Profile()
+    asyncio.run(concurrent(C1(partial(append, "c1s2")), profile)(state))
+    assert state.calls == ["c1s1", "c1s2", "c1s3"]
+    assert len(profile.export()) == 2
+
+
+def test_escaped_state():
+    """Steps passing the state elsewhere should wait for all earlier steps."""
+    state = State()
+    asyncio.run(concurrent(_D1())(state))
+    assert state.total == 10
+
+
+def test_declaration_order():
+    """Steps should be started in order of declaration without latencies."""
+    state = State(log=[])
+    asyncio.run(concurrent(_C1(), Profile())(state))
+    assert state.log == ["compute", "fetch", "store"]
+
+
+def test_longest_chain_first():
+    """Steps heading the longest chain should be started first."""
+    profile = Profile({"_C1.compute": 0.5, "_C1.fetch": 0.3, "_C1.store": 0.3})
+    state = State(log=[])
+    asyncio.run(concurrent(_C1(), profile)(state))
+    assert state.log == ["fetch", "compute", "store"]
+    assert state.stored == 1
+
+
+def test_record_latencies():
+    """Latencies of finished steps should be recorded as moving average."""
+    profile = Profile(weight=0.5)
+    asyncio.run(concurrent(_C1(), profile)(State(log=[])))
+    assert sorted(profile.export()) == ["_C1.compute", "_C1.fetch", "_C1.store"]
+    exported = profile.export()
+    exported["_C1.store"] = 1.0
+    profile = Profile(exported, weight=0.5)
+    profile.record("_C1.store", 3.0)
+    assert profile.estimate("_C1.store") == 2.0
+    assert profile.estimate("unknown") == 0.0
+
+
+def test_skip_failed_latencies():
+    """Latencies of failed steps should not be recorded."""
+    profile = Profile()
+    state = State(order_id=1, customer_id=-1, ticks=5)
+    with pytest.raises(_StepError):
+        asyncio.run(concurrent(_A1(), profile)(state))
+    assert profile.export() == {}
+
+
+def test_deny_function_stories():
+    """Deny to execute function stories concurrently."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        concurrent(A1())
+    expected = "concurrent can execute coroutine stories only"
+    assert str(exc_info.value) == expected
@@ -0,0 +1,223 @@
+"""Tests related to dataflow function."""
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
+from stories import Argument
+from stories import dataflow
+from stories import I
+from stories import State
+from stories import Story
+from stories import Variable
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+    I.a1s3
+    I.a1s4
+
+    def a1s1(self, state):
+        state.order = self.load_order(state.order_id)
+
+    def a1s2(self, state):
+        state.customer = state.customer_id
+
+    def a1s3(self, state):
+        state.count += hasattr(state, "cost") + bool(getattr(state, "order"))
+        del state.customer
+
+    def a1s4(self, state):
+        setattr(state, "payment", state.order)
+        state.total = 1
+        state.total = state.total + getattr(state, "count", 0)
+        state.order.name = "Books"
+        setattr(self, state.key, 1)
+        setattr(self, "order", state.order)
+        state.print()
+
+    def load_order(self, order_id):
+        return SimpleNamespace(id=order_id)
+
+
+class _C1(Story):
+    I.c1s1
+
+    async def c1s1(self, state):
+        state.customer = await state.load_customer(state.customer_id)
+
+
+class _A1State(State):
+    order_id = Argument()
+    customer_id = Argument()
+    order = Variable()
+    customer = Variable()
+    payment = Variable()
+    total = Variable()
+
+
+class _B1(Story):
+    I.b1s1
+    I.a1
+    I.b1s2
+    I.b1s3
+
+    def b1s1(self, state):
+        state.order_id = 1
+
+    def __init__(self, b1s2, b1s3):
+        self.a1 = _A1()
+        self.b1s2 = b1s2
+        self.b1s3 = b1s3
+
+
+def _b1s2(state):
+    state.receipt = state.payment
+
+
+def _b1s3(state):
+    state.total = 0
+
+
+async def _load_customer(customer_id):
+    return customer_id
+
+
+def _helper(state):
+    _b1s3(state)
+
+
+def _alias(state):
+    other = state
+    other.total = 0
+
+
+def _variables(state):
+    vars(state)["total"] = 0
+
+
+def _namespace(state):
+    state.__dict__["total"] = 0
+
+
+def _dynamic(state):
+    setattr(state, "to" + "tal", 0)
+
+
+def _unknown(*args):
+    args[0].total = 0
+
+
+class _Callable:
+    def __call__(self, state):
+        state.receipt = state.payment
+
+    __hash__ = None
+
+
+def _state(**kwargs):
+    return State(customer_id=2, cost=3, count=4, key="x", print=list, **kwargs)
+
+
+def test_steps():
+    """Each step should be analyzed separately."""
+    graph = dataflow(_A1)
+    assert graph.steps == ["a1s1", "a1s2", "a1s3", "a1s4"]
+    assert graph["a1s1"].reads == {"order_id"}
+    assert graph["a1s1"].writes == {"order"}
+    assert graph["a1s2"].reads == {"customer_id"}
+    assert graph["a1s2"].writes == {"customer"}
+    assert graph["a1s3"].reads == {"order", "cost", "count"}
+    assert graph["a1s3"].writes == {"count"}
+    assert graph["a1s4"].reads == {"order", "count", "key", "print"}
+    assert graph["a1s4"].writes == {"payment", "total"}
+    assert repr(graph["a1s1"]) == "a1s1(reads=['order_id'], writes=['order'])"
+    graph = dataflow(_C1)
+    assert graph["c1s1"].reads == {"customer_id", "load_customer"}
+    assert graph["c1s1"].writes == {"customer"}
+    story = _A1()
+    state = _state(order_id=1)
+    story(state)
+    assert (state.total, state.payment.name, story.x) == (7, "Books", 1)
+    state = _state(load_customer=_load_customer)
+    asyncio.run(_C1()(state))
+    assert state.customer == 2
+
+
+def test_graph():
+    """Graph should contain inputs, outputs and dependencies of steps."""
+    graph = dataflow(_A1)
+    assert graph.inputs == {"order_id", "customer_id", "cost", "count", "key", "print"}
+    assert graph.outputs == {"order", "customer", "count", "payment", "total"}
+    assert graph.edges == [
+        ("a1s1", "a1s3"),
+        ("a1s1", "a1s4"),
+        ("a1s3", "a1s4"),
+    ]
+
+
+def test_check():
+    """Check should report variables used against state declaration."""
+    assert dataflow(_A1).check(_A1State) == [
+        "a1s3 reads undeclared variable cost",
+        "a1s3 reads undeclared variable count",
+        "a1s3 assigns undeclared variable count",
+        "a1s4 reads undeclared variable count",
+        "a1s4 reads undeclared variable key",
+        "a1s4 reads undeclared variable print",
+    ]
+
+    class A2State(State):
+        order_id = Argument()
+        customer_id = Variable()
+        order = Variable()
+        customer = Variable()
+
+    errors = dataflow(_A1).check(A2State)
+    assert errors[0] == "a1s2 reads variable customer_id before it is assigned"
+
+
+def test_nested_stories():
+    """Nested stories and injected steps should be analyzed on story instance."""
+    story = _B1(_b1s2, _b1s3)
+    graph = dataflow(story)
+    assert graph["a1"].reads == dataflow(_A1).inputs
+    assert graph["a1"].writes == dataflow(_A1).outputs
+    assert graph["b1s2"].reads == {"payment"}
+    assert graph["b1s2"].writes == {"receipt"}
+    assert graph.inputs == {"customer_id", "cost", "count", "key", "print"}
+    state = _state()
+    story(state)
+    assert (state.receipt.id, state.total) == (1, 0)
+
+
+def test_unknown_steps():
+    """Steps without source code could not be analyzed."""
+    for step in [_unknown, _Callable(), partial(_b1s2), print, lambda state: None]:
+        graph = dataflow(_B1(_b1s2, step))
+        assert graph["b1s3"].reads is None
+        assert graph["b1s3"].writes is None
+        assert graph.inputs is None
+        assert graph.outputs is None
+        assert ("b1s1", "b1s3") in graph.edges
+        assert repr(graph["b1s3"]) == "b1s3(reads=None, writes=None)"
+    graph = dataflow(_B1(_b1s2, lambda state: None))
+    assert graph["b1s3"].reads is None
+    graph = dataflow(_B1)
+    assert graph["a1"].reads is None
+    assert graph.check(_A1State) == []
+    state = _state()
+    _B1(_Callable(), _unknown)(state)
+    assert state.total == 0
+
+
+def test_escaped_state():
+    """Steps passing the state anywhere else could not be analyzed."""
+    for step in [_helper, _alias, _variables, _namespace, _dynamic]:
+        graph = dataflow(_B1(_b1s2, step))
+        assert graph["b1s3"].reads is None
+        assert graph["b1s3"].writes is None
+        assert ("b1s2", "b1s3") in graph.edges
+        state = _state()
+        _B1(_b1s2, step)(state)
+        assert state.total == 0
@@ -0,0 +1,125 @@
+"""Tests related to deadline function."""
+import asyncio
+from functools import partial
+
+import pytest
+
+from stories import deadline
+from stories import I
+from stories import Profile
+from stories import remaining
+from stories import State
+from stories import Story
+from stories.exceptions import DeadlineError
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    async def a1s1(self, state):
+        state.first = remaining()
+        await asyncio.sleep(0)
+
+    async def a1s2(self, state):
+        state.second = remaining()
+        try:
+            await asyncio.sleep(state.delay)
+        except asyncio.CancelledError:
+            state.cancelled = True
+            raise
+        if state.delay < 0:
+            raise _StepError(state.delay)
+        nested = State()
+        await deadline(_B1(), 5)(nested)
+        state.nested = nested.remaining
+
+
+class _B1(Story):
+    I.b1s1
+    I.b1s2
+
+    async def b1s1(self, state):
+        state.remaining = remaining()
+
+    def __init__(self):
+        self.b1s2 = partial(_wait, 0)
+
+
+async def _wait(delay, state):
+    await asyncio.sleep(delay)
+
+
+class _StepError(Exception):
+    ...
+
+
+def test_remaining_time():
+    """Steps should be executed with remaining time of the deadline."""
+    state = State(delay=0)
+    asyncio.run(deadline(_A1(), 1)(state))
+    assert 0 < state.second <= state.first <= 1
+    assert remaining() is None
+
+
+def test_nested_deadline():
+    """Nested deadline should not exceed the outer one."""
+    state = State()
+    asyncio.run(deadline(_B1(), 5)(state))
+    assert 1 < state.remaining <= 5
+    state = State(delay=0)
+    asyncio.run(deadline(_A1(), 1)(state))
+    assert 0 < state.nested <= state.second
+
+
+def test_cancel_step():
+    """Step should be cancelled when deadline runs out."""
+    state = State(delay=10)
+    with pytest.raises(DeadlineError) as exc_info:
+        asyncio.run(deadline(_A1(), 0.05)(state))
+    assert exc_info.value.step == "a1s2"
+    assert str(exc_info.value) == "a1s2 step could not finish before the deadline"
+    assert isinstance(exc_info.value, StoryError)
+    assert state.cancelled
+
+
+def test_propagate_exception():
+    """Exception raised by step should be propagated as is."""
+    with pytest.raises(_StepError):
+        asyncio.run(deadline(_A1(), 1)(State(delay=-1)))
+
+
+def test_skip_slow_steps():
+    """Step which average latency does not fit should not be started."""
+    profile = Profile({"_A1.a1s2": 10.0})
+    state = State(delay=0)
+    with pytest.raises(DeadlineError) as exc_info:
+        asyncio.run(deadline(_A1(), 1, profile)(state))
+    assert exc_info.value.step == "a1s2"
+    assert not hasattr(state, "second")
+    assert sorted(profile.export()) == ["_A1.a1s1", "_A1.a1s2"]
+
+
+def test_expired_deadline():
+    """Steps should not be started after deadline."""
+    state = State(delay=0)
+    with pytest.raises(DeadlineError) as exc_info:
+        asyncio.run(deadline(_A1(), 0)(state))
+    assert exc_info.value.step == "a1s1"
+    assert not hasattr(state, "first")
+
+
+def test_deny_function_stories():
+    """Deny to execute function stories with deadline."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        deadline(A1(), 1)
+    expected = "deadline can execute coroutine stories only"
+    assert str(exc_info.value) == expected
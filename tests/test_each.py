@@ -0,0 +1,172 @@
+"""Tests related to fan-out steps."""
+import asyncio
+from threading import Barrier
+from threading import get_ident
+from time import sleep
+
+import pytest
+
+from stories import concurrent
+from stories import dataflow
+from stories import I
+from stories import State
+from stories import Story
+from stories import walk
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2.each("products", "product", "checks", "order", workers=2)
+
+    def a1s1(self, state):
+        state.order = "o1"
+
+    def __init__(self):
+        self.a1s2 = _B1()
+
+
+class _B1(Story):
+    I.b1s1
+
+    def b1s1(self, state):
+        if state.product < 0:
+            raise _StepError(state.product)
+        self.log.append(state.product)
+        if state.product == 0:
+            self.barrier.wait()
+        else:
+            sleep(0.01)
+        state.price = state.product * 2
+        state.thread = get_ident()
+
+    def __init__(self):
+        self.log = []
+        self.barrier = Barrier(2, timeout=5)
+
+
+class _C1(Story):
+    I.c1s1
+    I.c1s2.each("products", "product", "checks", workers=2)
+    I.c1s3
+
+    async def c1s1(self, state):
+        state.started = True
+
+    async def c1s3(self, state):
+        state.finished = True
+
+    def __init__(self):
+        self.c1s2 = _D1()
+
+
+class _D1(Story):
+    I.d1s1
+
+    async def d1s1(self, state):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            for _ in range(abs(state.product)):
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        if state.product < 0:
+            raise _StepError(state.product)
+        state.price = state.product * 2
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+
+
+class _E1(Story):
+    I.e1s1
+    I.e1s2.each("products", "product", "checks", "order", workers=2)
+
+    async def e1s1(self, state):
+        state.order = "o2"
+
+    e1s2 = _B1()
+
+
+class _StepError(Exception):
+    ...
+
+
+def test_function_fan_out():
+    """Nested story should be executed for each element in a pool of threads."""
+    story = _A1()
+    state = State(products=[0, 0, 1, 2])
+    story(state)
+    assert [check.product for check in state.checks] == [0, 0, 1, 2]
+    assert [check.price for check in state.checks] == [0, 0, 2, 4]
+    assert all(check.order == "o1" for check in state.checks)
+    assert len({check.thread for check in state.checks[:2]}) == 2
+
+
+def test_function_failure():
+    """First failure should cancel elements which were not started yet."""
+    story = _A1()
+    state = State(products=[0, 0, -1] + [1] * 50)
+    with pytest.raises(_StepError):
+        story(state)
+    assert not hasattr(state, "checks")
+    assert len(story.a1s2.log) < 52
+
+
+def test_coroutine_fan_out():
+    """Nested story should be executed for each element in limited tasks."""
+    story = _C1()
+    state = State(products=[3, 1, 2, 0])
+    asyncio.run(story(state))
+    assert [check.price for check in state.checks] == [6, 2, 4, 0]
+    assert story.c1s2.peak == 2
+    assert state.finished
+
+
+def test_coroutine_failure():
+    """First failure should cancel the rest of the tasks."""
+    story = _C1()
+    state = State(products=[1000, -1, 1000])
+    with pytest.raises(_StepError):
+        asyncio.run(story(state))
+    assert story.c1s2.cancelled >= 1
+    assert story.c1s2.active == 0
+    assert not hasattr(state, "checks")
+    assert not hasattr(state, "finished")
+
+
+def test_function_fan_out_coroutine_story():
+    """Function nested story should be executed in threads of coroutine story."""
+    state = State(products=[0, 0, 1])
+    asyncio.run(_E1()(state))
+    assert [check.price for check in state.checks] == [0, 0, 2]
+    assert state.checks[0].order == "o2"
+
+
+def test_walk_fan_out():
+    """Fan-out step should be a single step of the walk."""
+    state = State(products=[1, 2])
+    asyncio.run(walk(_C1())(state))
+    assert [check.price for check in state.checks] == [2, 4]
+    assert state.finished
+
+
+def test_concurrent_fan_out():
+    """Fan-out step should depend on steps assigning its collection."""
+    state = State(products=[1, 2])
+    asyncio.run(concurrent(_C1())(state))
+    assert [check.price for check in state.checks] == [2, 4]
+
+
+def test_dataflow():
+    """Fan-out step should read its collection and assign its results."""
+    graph = dataflow(_A1)
+    assert repr(graph["a1s2"]) == (
+        "a1s2(reads=['order', 'products'], writes=['checks'])"
+    )
+    assert graph.edges == [("a1s1", "a1s2")]
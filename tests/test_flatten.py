@@ -0,0 +1,116 @@
+"""Tests related to flatten function."""
+import pytest
+
+from stories import flatten
+from stories import I
+from stories import initiate
+from stories import State
+from stories import Story
+
+
+def test_execute_steps(r, m):
+    """Flat story should execute steps of nested stories in the given order."""
+
+    class A1(Story):
+        I.a1s1
+        I.a1s2
+
+        a1s1 = m._append_method("calls", "a1s1")
+        a1s2 = m._append_method("calls", "a1s2")
+
+    class B1(Story):
+        I.b1s1
+        I.a1
+        I.b1s2
+
+        b1s1 = m._append_method("calls", "b1s1")
+        b1s2 = m._append_method("calls", "b1s2")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    @initiate
+    class C1(Story):
+        I.b1
+        I.a1
+
+    # First level.
+
+    story = flatten(A1())
+    state = State(calls=[])
+    assert r.run(story, state) is None
+    assert state.calls == ["a1s1", "a1s2"]
+
+    # Second level.
+
+    story = flatten(B1())
+    state = State(calls=[])
+    assert r.run(story, state) is None
+    assert state.calls == ["b1s1", "a1s1", "a1s2", "b1s2"]
+
+    # Third level.
+
+    story = flatten(C1(b1=B1(), a1=A1()))
+    state = State(calls=[])
+    assert r.run(story, state) is None
+    assert state.calls == ["b1s1", "a1s1", "a1s2", "b1s2", "a1s1", "a1s2"]
+
+
+def test_resolve_once(r, m):
+    """Flat story should keep steps resolved at the moment of flattening."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    class A2(Story):
+        I.a2s1
+
+        a2s1 = m._append_method("calls", "a2s1")
+
+    class B1(Story):
+        I.b1s1
+        I.a1
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    origin = B1()
+    story = flatten(origin)
+    origin.a1 = A2()
+
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["b1s1", "a1s1"]
+
+
+def test_propagate_exceptions(r, m):
+    """Flat story should propagate exceptions raised by nested story steps."""
+
+    class A1(Story):
+        I.a1s1
+        I.a1s2
+
+        a1s1 = m._error_method("error in a1s1")
+        a1s2 = m._append_method("calls", "a1s2")
+
+    class B1(Story):
+        I.b1s1
+        I.a1
+        I.b1s2
+
+        b1s1 = m._append_method("calls", "b1s1")
+        b1s2 = m._append_method("calls", "b1s2")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    story = flatten(B1())
+    state = State(calls=[])
+    with pytest.raises(m._StepError) as exc_info:
+        r.run(story, state)
+    assert str(exc_info.value) == "error in a1s1"
+    assert state.calls == ["b1s1"]
@@ -0,0 +1,205 @@
+"""Tests related to hedged steps."""
+import asyncio
+
+import pytest
+
+from stories import hedges
+from stories import I
+from stories import run_pipeline
+from stories import State
+from stories import Story
+
+
+class _A1(Story):
+    I.a1s1.hedge()
+    I.a1s2
+
+    async def a1s1(self, state):
+        await _attempt(state)
+
+    async def a1s2(self, state):
+        state.done = True
+
+
+class _B1(Story):
+    I.b1s1.hedge()
+
+    async def b1s1(self, state):
+        await _attempt(state)
+
+
+class _C1(Story):
+    I.c1s1.hedge()
+
+    async def c1s1(self, state):
+        await _attempt(state)
+
+
+class _D1(Story):
+    I.d1s1.hedge()
+    I.d1s2
+
+    async def d1s1(self, state):
+        await _attempt(state)
+
+    async def d1s2(self, state):
+        state.done = True
+
+
+class _E1(Story):
+    I.e1s1.hedge()
+    I.e1s2
+
+    def e1s1(self, state):
+        state.first = True
+
+    async def e1s2(self, state):
+        state.second = True
+
+
+class _F1(Story):
+    I.f1s1.hedge(0.5)
+
+    def f1s1(self, state):
+        state.first = True
+
+
+class _G1(Story):
+    I.g1s1.hedge()
+
+    async def g1s1(self, state):
+        await _attempt(state)
+
+
+class _H1(Story):
+    I.h1s1.hedge()
+
+    async def h1s1(self, state):
+        await _attempt(state)
+
+
+class _StepError(Exception):
+    ...
+
+
+async def _attempt(state):
+    delay = state.delays.pop(0)
+    try:
+        await asyncio.sleep(abs(delay))
+    except asyncio.CancelledError:
+        state.cancelled.append(delay)
+        raise
+    if delay < 0:
+        raise _StepError(delay)
+    state.winner = delay
+
+
+def _state(*delays):
+    return State(delays=list(delays), cancelled=[])
+
+
+def _warm(story):
+    for _ in range(10):
+        asyncio.run(story(_state(0)))
+
+
+def test_warmup():
+    """Step should not be hedged until enough latencies were measured."""
+    story = _A1()
+    hedge = hedges(story)["a1s1"]
+    assert hedge.delay() is None
+    _warm(story)
+    assert hedge.delay() is not None
+    assert (hedge.calls, hedge.hedged, hedge.won) == (10, 0, 0)
+    assert hedge.hedge_rate == hedge.win_rate == 0.0
+
+
+def test_hedge_wins():
+    """Second attempt should be started and win if first one is slow."""
+    story = _B1()
+    _warm(story)
+    state = _state(5, 0)
+    asyncio.run(story(state))
+    assert state.winner == 0
+    assert state.cancelled == [5]
+    hedge = hedges(_B1)["b1s1"]
+    assert (hedge.calls, hedge.hedged, hedge.won) == (11, 1, 1)
+    assert hedge.delay() < 5
+
+
+def test_cancelled_latency():
+    """Cancelled first attempt should not lower the measured latencies."""
+    story = _H1()
+    hedge = hedges(_H1)["h1s1"]
+    hedge.latencies.extend([0.001] * 9 + [1.0])
+    state = _state(5, 0)
+    asyncio.run(story(state))
+    assert state.winner == 0
+    assert hedge.latencies[-1] == 1.0
+
+
+def test_primary_wins():
+    """First attempt should win if it finishes before the hedged one."""
+    story = _C1()
+    _warm(story)
+    state = _state(0.05, 5)
+    asyncio.run(story(state))
+    assert state.winner == 0.05
+    assert state.cancelled == [5]
+    hedge = hedges(_C1)["c1s1"]
+    assert hedge.hedge_rate == 1 / 11
+    assert hedge.win_rate == 0.0
+
+
+def test_hedge_error():
+    """Error of the first attempt should propagate if every attempt failed."""
+    story = _D1()
+    _warm(story)
+    state = _state(-0.05, -0.01)
+    with pytest.raises(_StepError) as exc_info:
+        asyncio.run(story(state))
+    assert exc_info.value.args == (-0.05,)
+    assert state.cancelled == []
+    assert not hasattr(state, "done")
+
+
+def test_failed_hedge():
+    """Slow attempt should win if the other one failed."""
+    story = _G1()
+    _warm(story)
+    state = _state(0.05, -0.01)
+    asyncio.run(story(state))
+    assert state.winner == 0.05
+    assert state.cancelled == []
+    hedge = hedges(_G1)["g1s1"]
+    assert (hedge.hedged, hedge.won) == (1, 0)
+
+
+def test_hedge_pipeline():
+    """Hedged step should be executed as a stage of a pipeline."""
+    states = [_state(0, 0) for _ in range(12)]
+
+    async def collect():
+        return [state async for state in run_pipeline(_A1(), states, 2)]
+
+    assert asyncio.run(collect()) == states
+    assert all(state.done for state in states)
+
+
+def test_sync_step():
+    """Hedged step defined as a function should be called once."""
+    state = State()
+    asyncio.run(_E1()(state))
+    assert state.first
+    assert state.second
+    assert hedges(_E1)["e1s1"].calls == 0
+
+
+def test_function_story():
+    """Hedged step of function story should be called once."""
+    state = State()
+    _F1()(state)
+    assert state.first
+    assert repr(hedges(_F1())) == (
+        "{'f1s1': Hedge(percentile=0.5, calls=0, hedged=0, won=0)}"
+    )
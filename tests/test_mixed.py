@@ -0,0 +1,251 @@
+"""Tests related to sync steps in coroutine stories."""
+import asyncio
+from functools import partial
+from threading import get_ident
+
+import pytest
+
+from stories import flatten
+from stories import I
+from stories import State
+from stories import Story
+from stories import walk
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1.inline()
+    I.a1s2
+    I.a1s3.blocking()
+
+    def a1s1(self, state):
+        state.calls = ["a1s1"]
+
+    async def a1s2(self, state):
+        await asyncio.sleep(0)
+        state.calls.append("a1s2")
+
+    def a1s3(self, state):
+        state.thread = get_ident()
+        state.calls.append("a1s3")
+
+
+class _B1(Story):
+    I.a1
+    I.b1s1.inline()
+
+    def b1s1(self, state):
+        state.calls.append("b1s1")
+
+    def __init__(self):
+        self.a1 = _A1()
+
+
+class _C1(Story):
+    I.c1s1.inline()
+    I.c1s2.blocking()
+
+    def c1s1(self, state):
+        state.calls = ["c1s1"]
+
+    def c1s2(self, state):
+        state.thread = get_ident()
+        state.calls.append("c1s2")
+
+
+@pytest.mark.parametrize("execute", [_A1(), walk(_A1()), flatten(_A1())])
+def test_coroutine(execute):
+    """Inline steps should be called directly, blocking steps in a thread."""
+    state = State()
+    asyncio.run(execute(state))
+    assert state.calls == ["a1s1", "a1s2", "a1s3"]
+    assert state.thread != get_ident()
+
+
+@pytest.mark.parametrize("execute", [_B1(), walk(_B1()), flatten(_B1())])
+def test_nested_coroutine(execute):
+    """Any coroutine step of nested stories should make story a coroutine."""
+    state = State()
+    asyncio.run(execute(state))
+    assert state.calls == ["a1s1", "a1s2", "a1s3", "b1s1"]
+
+
+@pytest.mark.parametrize("execute", [_C1(), walk(_C1()), flatten(_C1())])
+def test_function(execute):
+    """Marked steps should be called directly in function stories."""
+    state = State()
+    execute(state)
+    assert state.calls == ["c1s1", "c1s2"]
+    assert state.thread == get_ident()
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_undeclared_sync_steps(r, m, wrap):
+    """Sync steps and sync stories should be called without await."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            state.calls.append("a1s1")
+            return 1
+
+    class B1(Story):
+        I.b1s1
+        I.b1s2
+        I.a1
+        I.b1s3
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        def b1s2(self, state):
+            state.calls.append("b1s2")
+            return 1
+
+        def __init__(self, b1s3):
+            self.a1 = A1()
+            self.b1s3 = b1s3
+
+    def b1s3(state):
+        state.calls.append("b1s3")
+        return 1
+
+    state = State(calls=[])
+    r.run(wrap(B1(b1s3)), state)
+    assert state.calls == ["b1s1", "b1s2", "a1s1", "b1s3"]
+    state = State(calls=[])
+    r.run(wrap(B1(partial(m._append_method("calls", "b1s3"), None))), state)
+    assert state.calls == ["b1s1", "b1s2", "a1s1", "b1s3"]
+
+
+class _H1(Story):
+    I.h1s1
+
+    def h1s1(self, state):
+        state.thread = get_ident()
+        state.calls.append("h1s1")
+
+
+class _D1(Story):
+    I.d1s1
+    I.d1s2
+
+    def d1s1(self, state):
+        state.calls = ["d1s1"]
+
+    def __init__(self, d1s2):
+        self.d1s2 = d1s2
+
+
+class _E1(Story):
+    I.e1s1
+
+    def e1s1(self, state):
+        state.calls.append("e1s1")
+
+
+class _F1(Story):
+    I.f1s1
+
+    async def f1s1(self, state):
+        await asyncio.sleep(0)
+        state.calls.append("f1s1")
+
+
+def test_reassign_nested_story():
+    """Story should be awaited after any of its steps became a coroutine."""
+    story = _D1(_E1())
+    state = State()
+    story(state)
+    assert state.calls == ["d1s1", "e1s1"]
+    story.d1s2 = _F1()
+    state = State()
+    asyncio.run(story(state))
+    assert state.calls == ["d1s1", "f1s1"]
+    story.d1s2 = _E1()
+    state = State()
+    story(state)
+    assert state.calls == ["d1s1", "e1s1"]
+
+
+class _I1(Story):
+    I.i1s1
+
+    def __init__(self, i1s1):
+        self.i1s1 = i1s1
+
+
+def _sync_step(state):
+    state.calls.append("sync")
+
+
+async def _async_step(state):
+    await asyncio.sleep(0)
+    state.calls.append("async")
+
+
+def test_reassign_deeply_nested_step():
+    """Story should be awaited after a step of its nested story became a coroutine."""
+    story = _D1(_I1(_sync_step))
+    state = State()
+    story(state)
+    assert state.calls == ["d1s1", "sync"]
+    story.d1s2.i1s1 = _async_step
+    state = State()
+    asyncio.run(story(state))
+    assert state.calls == ["d1s1", "async"]
+    story.d1s2.i1s1 = _sync_step
+    state = State()
+    story(state)
+    assert state.calls == ["d1s1", "sync"]
+
+
+class _G1(Story):
+    I.g1s1
+    I.h1.blocking()
+
+    async def g1s1(self, state):
+        state.calls = ["g1s1"]
+
+    h1 = _H1()
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_blocking_nested_story(wrap):
+    """Blocking nested story should be executed in a thread."""
+    state = State()
+    asyncio.run(wrap(_G1())(state))
+    assert state.calls == ["g1s1", "h1s1"]
+    assert state.thread != get_ident()
+
+
+class _J1(Story):
+    I.j1s1
+    I.j1s2.blocking()
+
+    async def j1s1(self, state):
+        raise RuntimeError
+
+    def __init__(self, j1s2):
+        self.j1s2 = j1s2
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_deny_blocking_coroutine_step(wrap):
+    """Injected coroutine step could not be declared blocking."""
+    with pytest.raises(StoryError) as exc_info:
+        asyncio.run(wrap(_J1(_async_step))(State()))
+    assert str(exc_info.value) == "Coroutine step can not be declared blocking"
+
+
+def test_deny_inline_coroutine_step():
+    """Coroutine step could not be declared inline."""
+    with pytest.raises(StoryError) as exc_info:
+
+        class A1(Story):
+            I.a1s1.inline()
+
+            async def a1s1(self, state):
+                raise RuntimeError
+
+    assert str(exc_info.value) == "Coroutine step can not be declared inline"
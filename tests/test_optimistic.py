@@ -0,0 +1,238 @@
+"""Tests related to optimistic function."""
+from datetime import date
+from threading import Barrier
+from threading import current_thread
+
+import pytest
+
+from stories import optimistic
+from stories import Argument
+from stories import I
+from stories import State
+from stories import Story
+from stories import Variable
+from stories.exceptions import StateError
+from stories.exceptions import StoryError
+from validators import _is_integer
+
+
+class _A1(Story):
+    I.find_order
+    I.find_customer
+    I.check_balance
+    I.persist_payment.ordered()
+    I.send_receipt
+
+    def find_order(self, state):
+        self.barrier.wait()
+        state.order = state.order_id * 10
+        state.order = state.order + 1
+
+    def find_customer(self, state):
+        self.barrier.wait()
+        state.customer = state.customer_id
+        state.thread = current_thread()
+
+    def check_balance(self, state):
+        self.calls.append("check_balance")
+        if state.order > state.customer:
+            raise _StepError(state.order)
+
+    def persist_payment(self, state):
+        self.calls.append("persist_payment")
+        state.payment = state.order
+
+    def send_receipt(self, state):
+        self.calls.append("send_receipt")
+
+    def __init__(self):
+        self.barrier = Barrier(2, timeout=5)
+        self.calls = []
+
+
+class _B1(Story):
+    I.b1s1
+    I.b1s2
+    I.b1s3
+
+    def b1s1(self, state):
+        setattr(state, self.name, "1")
+
+    def b1s2(self, state):
+        self.calls.append("b1s2")
+        if state.number < 0:
+            raise _StepError(state.number)
+        state.result = state.number + 1
+
+    def b1s3(self, state):
+        self.calls.append("b1s3")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+
+class _C1(Story):
+    I.c1s1
+    I.c1s2
+
+    c1s1 = staticmethod(lambda state: setattr(state, "other", "1"))
+
+    def c1s2(self, state):
+        state.result = state.number + 1
+
+
+class _D1(Story):
+    I.d1s1
+    I.d1s2
+
+    def d1s1(self, state):
+        state.first = "2000-01-01"
+
+    def d1s2(self, state):
+        state.second = "2000-01-02"
+
+
+class _E1(Story):
+    I.e1s1
+    I.e1s2
+
+    def e1s1(self, state):
+        state.x = 1
+
+    def e1s2(self, state):
+        state.y = 1
+
+
+class _F1(Story):
+    I.f1s1
+    I.f1s2
+
+    def f1s1(self, state):
+        inner = State()
+        self.inner(inner)
+        state.first = inner.x
+
+    def f1s2(self, state):
+        inner = State()
+        self.inner(inner)
+        state.second = inner.y
+
+    def __init__(self):
+        self.inner = optimistic(_E1(), 2)
+
+
+class _B1State(State):
+    number = Argument(_is_integer)
+    other = Variable(_is_integer)
+    result = Variable(_is_integer)
+
+
+class _D1State(State):
+    first = Variable(date.fromisoformat)
+    second = Variable(date.fromisoformat)
+
+
+class _StepError(Exception):
+    ...
+
+
+def test_independent_steps():
+    """Adjacent independent steps should be executed in threads."""
+    story = _A1()
+    state = State(order_id=1, customer_id=20)
+    optimistic(story, 2)(state)
+    assert (state.order, state.customer, state.payment) == (11, 20, 11)
+    assert state.thread is not current_thread()
+    assert story.calls == ["check_balance", "persist_payment", "send_receipt"]
+
+
+def test_close():
+    """Threads should be reused between calls and stopped on close."""
+    with optimistic(_A1(), 2) as execute:
+        first = State(order_id=1, customer_id=20)
+        execute(first)
+        second = State(order_id=1, customer_id=20)
+        execute(second)
+        assert first.thread.is_alive()
+    assert not first.thread.is_alive()
+    assert not second.thread.is_alive()
+    execute.close()
+
+
+def test_nested_runner():
+    """Step executed in a thread should be able to execute another story."""
+    story = _F1()
+    state = State()
+    with story.inner, optimistic(story, 2) as execute:
+        execute(state)
+    assert (state.first, state.second) == (1, 1)
+
+
+def test_propagate_exception():
+    """Exception should be propagated after assignments of earlier steps."""
+    story = _A1()
+    state = State(order_id=3, customer_id=20)
+    with pytest.raises(_StepError):
+        optimistic(story, 4)(state)
+    assert (state.order, state.customer) == (31, 20)
+    assert story.calls == ["check_balance"]
+
+
+@pytest.mark.parametrize("number", ["2", -1])
+def test_conflict(number):
+    """Step which read variable assigned by earlier step should be executed again."""
+    story = _B1("number")
+    state = _B1State(number=number)
+    optimistic(story, 3)(state)
+    assert state.number == 1
+    assert state.result == 2
+    assert story.calls.count("b1s2") == 2
+    assert story.calls.count("b1s3") == 2
+
+
+def test_no_conflict():
+    """Assignments should be validated and applied in order of steps."""
+    story = _B1("other")
+    state = _B1State(number="2")
+    optimistic(story, 3)(state)
+    assert (state.other, state.result) == (1, 3)
+    assert sorted(story.calls) == ["b1s2", "b1s3"]
+    state = _B1State(number="2")
+    optimistic(_C1(), 2)(state)
+    assert (state.other, state.result) == (1, 3)
+    story = _B1("unknown")
+    with pytest.raises(StateError):
+        optimistic(story, 3)(_B1State(number="2"))
+
+
+def test_validate_once():
+    """Assignments should be validated once when they are made."""
+    state = _D1State()
+    optimistic(_D1(), 2)(state)
+    assert (state.first, state.second) == (date(2000, 1, 1), date(2000, 1, 2))
+
+
+def test_propagate_group_exception():
+    """Exception of step executed in threads should be propagated."""
+    story = _B1("other")
+    state = _B1State(number=-1)
+    with pytest.raises(_StepError):
+        optimistic(story, 3)(state)
+    assert state.other == 1
+    assert not hasattr(state, "result")
+
+
+def test_deny_coroutine_stories():
+    """Deny to execute coroutine stories in threads."""
+
+    class A1(Story):
+        I.a1s1
+
+        async def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        optimistic(A1(), 2)
+    expected = "optimistic can not execute coroutine stories"
+    assert str(exc_info.value) == expected
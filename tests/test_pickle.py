@@ -0,0 +1,79 @@
+"""Tests related to pickling of stories and states."""
+import pickle
+
+from stories import Argument
+from stories import I
+from stories import initiate
+from stories import State
+from stories import Story
+from stories import Union
+from stories import Variable
+from validators import _is_integer
+
+
+class _A1(Story):
+    I.a1s1
+
+    def a1s1(self, state):
+        state.result = state.number * 2
+
+
+@initiate
+class _B1(Story):
+    I.a1
+
+
+class _A1State(State):
+    number = Argument(_is_integer)
+    result = Variable(_is_integer)
+
+
+class _B1State(State):
+    total = Variable(_is_integer)
+
+
+def test_pickle_state():
+    """State could be pickled with its variables."""
+    state = _A1State(number="7")
+    _A1().a1s1(state)
+    copied = pickle.loads(pickle.dumps(state))
+    assert type(copied) is _A1State
+    assert copied.number == 7
+    assert copied.result == 14
+
+
+def test_pickle_union():
+    """Union state would be restored as the same union class."""
+    state_class = Union(_A1State, _B1State)
+    state = state_class(number=1)
+    state.total = 2
+    copied = pickle.loads(pickle.dumps(state))
+    assert type(copied) is state_class
+    assert pickle.loads(pickle.dumps(state_class)) is state_class
+    assert (copied.number, copied.total) == (1, 2)
+
+
+def test_pickle_nested_union():
+    """Union of unions could be pickled."""
+    state_class = Union(Union(_A1State, _B1State), _B1State)
+    assert pickle.loads(pickle.dumps(state_class)) is state_class
+
+
+def test_union_identity():
+    """Union of the same states should be the same class."""
+    assert Union(_A1State, _B1State) is Union(_A1State, _B1State)
+    assert Union(_A1State, _B1State) is not Union(_B1State, _A1State)
+
+
+def test_pickle_initiate():
+    """Story decorated by @initiate could be pickled."""
+    story = _B1(a1=_A1())
+    state = _A1State(number=2)
+    story(state)
+    copied = pickle.loads(pickle.dumps(story))
+    assert type(copied) is _B1
+    assert _B1.__qualname__ == "_B1"
+    assert _B1.__module__ == __name__
+    state = _A1State(number=3)
+    copied(state)
+    assert state.result == 6
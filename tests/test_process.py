@@ -0,0 +1,126 @@
+"""Tests related to steps executed in processes."""
+import asyncio
+from os import getpid
+
+import pytest
+
+from stories import Argument
+from stories import flatten
+from stories import I
+from stories import State
+from stories import Story
+from stories import Variable
+from stories import walk
+from stories.exceptions import StoryError
+from validators import _is_integer
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2.process("items", "number")
+    I.a1s3
+
+    def a1s1(self, state):
+        state.items = [1, 2, 3]
+
+    @staticmethod
+    def a1s2(state):
+        state.process = getpid()
+        state.total = str(sum(state.items) * state.number)
+
+    def a1s3(self, state):
+        state.done = True
+
+
+class _B1(Story):
+    I.b1s1
+    I.a1s2.process("items", "number")
+
+    async def b1s1(self, state):
+        await asyncio.sleep(0)
+        state.items = [4, 5]
+
+    a1s2 = staticmethod(_A1.a1s2)
+
+
+class _C1(Story):
+    I.c1s1.process("number")
+
+    @staticmethod
+    def c1s1(state):
+        state.total = state.items
+
+
+class _D1(Story):
+    I.a1s2.process("items", "number")
+
+    a1s2 = staticmethod(_A1.a1s2)
+
+
+class _E1(Story):
+    I.e1s1.process("number")
+
+    def e1s1(self, state):
+        raise RuntimeError
+
+
+class _F1(Story):
+    I.e1
+
+    def __init__(self):
+        self.e1 = _E1()
+
+
+class _A1State(State):
+    number = Argument(_is_integer)
+    items = Variable()
+    process = Variable()
+    total = Variable(_is_integer)
+    done = Variable()
+
+
+@pytest.mark.parametrize("execute", [_A1(), walk(_A1()), flatten(_A1())])
+def test_function(execute):
+    """Process step should change state through validated assignment."""
+    state = _A1State(number=2)
+    execute(state)
+    assert state.process != getpid()
+    assert state.total == 12
+    assert state.items == [1, 2, 3]
+    assert state.done is True
+
+
+@pytest.mark.parametrize("execute", [_B1(), walk(_B1()), flatten(_B1())])
+def test_coroutine(execute):
+    """Process step could be awaited in coroutine stories."""
+    state = _A1State(number=3)
+    asyncio.run(execute(state))
+    assert state.process != getpid()
+    assert state.total == 27
+
+
+def test_merge_assignments_only():
+    """Variables which were only read by the step should stay untouched."""
+    state = _A1State(number=1)
+    items = [7]
+    state.items = items
+    _D1()(state)
+    assert state.items is items
+    assert state.total == 7
+
+
+def test_declared_reads():
+    """Process step should receive only declared variables."""
+    state = State(number=1, items=[1])
+    with pytest.raises(AttributeError):
+        _C1()(state)
+    assert not hasattr(state, "total")
+
+
+@pytest.mark.parametrize("wrap", [lambda story: story, walk, flatten])
+def test_deny_story_methods(wrap):
+    """Method of the story could not be executed in a process."""
+    with pytest.raises(StoryError) as exc_info:
+        wrap(_F1())(State(number=2))
+    expected = "Process step can not be a method of the story"
+    assert str(exc_info.value) == expected
@@ -0,0 +1,186 @@
+"""Tests related to run_concurrently function."""
+import asyncio
+
+import pytest
+
+from stories import I
+from stories import run_concurrently
+from stories import State
+from stories import Story
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    async def a1s1(self, state):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        for _ in range(state.ticks):
+            await asyncio.sleep(0)
+
+    async def a1s2(self, state):
+        self.active -= 1
+        if state.ticks < 0:
+            raise _StepError(state.ticks)
+        state.done = True
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+
+class _StepError(Exception):
+    ...
+
+
+def _collect(*args, **kwargs):
+    async def collect():
+        return [result async for result in run_concurrently(*args, **kwargs)]
+
+    return asyncio.run(collect())
+
+
+def test_ordered_results():
+    """Results should follow order of states."""
+    states = [State(ticks=3), State(ticks=1), State(ticks=2)]
+    result = _collect(_A1(), states, 3)
+    assert result == states
+    assert all(state.done for state in states)
+
+
+def test_completed_results():
+    """Results should follow order of completion."""
+    states = [State(ticks=30), State(ticks=10), State(ticks=20)]
+    result = _collect(_A1(), states, 3, ordered=False)
+    assert result == [states[1], states[2], states[0]]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_limit_concurrency(ordered):
+    """No more than limit stories should be in progress at the same time."""
+    story = _A1()
+    states = [State(ticks=ticks) for ticks in [3, 1, 2, 5, 1, 1, 4]]
+    result = _collect(story, states, 2, ordered=ordered)
+    assert sorted(result, key=states.index) == states
+    assert story.peak == 2
+
+
+def test_asynchronous_iterable():
+    """States could be given as asynchronous iterable."""
+    states = [State(ticks=2), State(ticks=1)]
+
+    async def iterate():
+        for state in states:
+            await asyncio.sleep(0)
+            yield state
+
+    result = _collect(_A1(), iterate(), 2)
+    assert result == states
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_stream_results(ordered):
+    """Finished results should be given while next state is not ready yet."""
+    states = [State(ticks=1), State(ticks=2)]
+    received = asyncio.Event()
+
+    async def iterate():
+        yield states[0]
+        await received.wait()
+        yield states[1]
+
+    async def collect():
+        result = []
+        async for pair in run_concurrently(
+            _A1(), iterate(), 3, ordered=ordered, collect=True
+        ):
+            result.append(pair)
+            received.set()
+        return result
+
+    assert asyncio.run(collect()) == [(states[0], None), (states[1], None)]
+
+
+def test_stream_failure():
+    """Failure should be propagated while the stream waits for next state."""
+    states = [State(ticks=50), State(ticks=-1)]
+
+    async def iterate():
+        yield states[0]
+        yield states[1]
+        await asyncio.Event().wait()
+
+    with pytest.raises(_StepError):
+        _collect(_A1(), iterate(), 3)
+    assert not hasattr(states[0], "done")
+
+
+def test_stream_backpressure():
+    """States should not be taken ahead of a consumer which does not ask."""
+    pulled = []
+
+    async def iterate():
+        while True:
+            pulled.append(State(ticks=0))
+            yield pulled[-1]
+
+    async def first():
+        results = run_concurrently(_A1(), iterate(), 4)
+        for _ in range(3):
+            await results.__anext__()
+        await asyncio.sleep(0)
+        await results.aclose()
+
+    asyncio.run(first())
+    assert len(pulled) <= 3 + 4 + 1
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_cancel_on_failure(ordered):
+    """First failure should cancel stories in progress and propagate."""
+    states = [State(ticks=5), State(ticks=-1), State(ticks=5), State(ticks=1)]
+    with pytest.raises(_StepError):
+        _collect(_A1(), states, 3, ordered=ordered)
+    assert not any(hasattr(state, "done") for state in states)
+
+
+def test_cancel_on_exit():
+    """Stories in progress should be cancelled when caller stops iteration."""
+    states = [State(ticks=1), State(ticks=5), State(ticks=5)]
+
+    async def first():
+        results = run_concurrently(_A1(), states, 3)
+        state = await results.__anext__()
+        await results.aclose()
+        return state
+
+    assert asyncio.run(first()) is states[0]
+    assert not any(hasattr(state, "done") for state in states[1:])
+
+
+def test_collect_errors():
+    """Exceptions should be collected next to the state which caused them."""
+    states = [State(ticks=2), State(ticks=-1), State(ticks=1)]
+    result = _collect(_A1(), states, 2, collect=True)
+    assert [state for state, error in result] == states
+    assert result[0][1] is None
+    assert isinstance(result[1][1], _StepError)
+    assert result[2][1] is None
+    assert states[2].done
+
+
+def test_deny_function_stories():
+    """Deny to execute synchronous stories concurrently."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        run_concurrently(A1(), [State()], 2)
+    expected = "run_concurrently can execute coroutine stories only"
+    assert str(exc_info.value) == expected
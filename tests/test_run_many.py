@@ -0,0 +1,79 @@
+"""Tests related to run_many function."""
+import pytest
+
+from stories import flatten
+from stories import I
+from stories import run_many
+from stories import State
+from stories import Story
+
+
+def test_execute_states(r, m):
+    """Story should be executed with every state in the given order."""
+
+    class A1(Story):
+        I.a1s1
+        I.a1s2
+
+        a1s1 = m._append_method("calls", "a1s1")
+        a1s2 = m._append_method("calls", "a1s2")
+
+    states = [State(calls=[]), State(calls=[]), State(calls=[])]
+    result = r.collect(run_many(A1(), iter(states)))
+    assert result == states
+    assert [state.calls for state in states] == [["a1s1", "a1s2"]] * 3
+
+
+def test_execute_callables(r, m):
+    """Flat story should be executed with every state as well."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    class B1(Story):
+        I.a1
+        I.b1s1
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    states = [State(calls=[]), State(calls=[])]
+    result = r.collect(run_many(flatten(B1()), states))
+    assert result == states
+    assert [state.calls for state in states] == [["a1s1", "b1s1"]] * 2
+
+
+def test_fail_fast(r, m):
+    """Exception should stop the batch and propagate to the caller."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    states = [State(calls=[]), State(calls=None), State(calls=[])]
+    with pytest.raises(AttributeError):
+        r.collect(run_many(A1(), states))
+    assert states[0].calls == ["a1s1"]
+    assert states[2].calls == []
+
+
+def test_collect_errors(r, m):
+    """Exceptions should be collected next to the state which caused them."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    states = [State(calls=[]), State(calls=None), State(calls=[])]
+    result = r.collect(run_many(A1(), states, collect=True))
+    assert [state for state, error in result] == states
+    assert result[0][1] is None
+    assert isinstance(result[1][1], AttributeError)
+    assert result[2][1] is None
+    assert states[2].calls == ["a1s1"]
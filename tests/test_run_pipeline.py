@@ -0,0 +1,195 @@
+"""Tests related to run_pipeline function."""
+import asyncio
+from threading import Barrier
+from threading import Event
+from threading import get_ident
+from threading import Timer
+
+import pytest
+
+from stories import I
+from stories import run_pipeline
+from stories import State
+from stories import Story
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    def a1s1(self, state):
+        state.first = get_ident()
+        if state.number == 0:
+            self.event.wait(timeout=5)
+        if state.number == 2:
+            self.barrier.wait()
+
+    def a1s2(self, state):
+        state.second = get_ident()
+        if state.number < 0:
+            raise _StepError(state.number)
+        state.result = state.number * 2
+        if state.number == 1:
+            self.event.set()
+
+    def __init__(self):
+        self.event = Event()
+        self.barrier = Barrier(1, timeout=5)
+
+
+class _B1(Story):
+    I.b1s1
+    I.a1
+
+    def b1s1(self, state):
+        state.number = state.number + 1
+
+    def __init__(self):
+        self.a1 = _A1()
+
+
+class _C1(Story):
+    I.c1s1
+    I.c1s2
+    I.c1s3
+
+    async def c1s1(self, state):
+        for _ in range(state.ticks):
+            await asyncio.sleep(0)
+        state.log.append("c1s1")
+
+    def c1s2(self, state):
+        if state.ticks < 0:
+            raise _StepError(state.ticks)
+        state.log.append("c1s2")
+
+    async def c1s3(self, state):
+        state.log.append("c1s3")
+
+
+class _StepError(Exception):
+    ...
+
+
+def _collect(*args, **kwargs):
+    async def collect():
+        return [result async for result in run_pipeline(*args, **kwargs)]
+
+    return asyncio.run(collect())
+
+
+async def _states(states):
+    for state in states:
+        yield state
+
+
+def test_ordered_results():
+    """Results should follow order of states."""
+    states = [State(number=number) for number in range(1, 12)]
+    result = list(run_pipeline(_A1(), iter(states), 2))
+    assert result == states
+    assert [state.result for state in states] == list(range(2, 24, 2))
+    assert {state.first for state in states}.isdisjoint(
+        {state.second for state in states}
+    )
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_completed_results(ordered):
+    """Results should be given in order of completion unless ordered."""
+    states = [State(number=number) for number in range(3)]
+    result = list(run_pipeline(_A1(), states, [2, 1], ordered=ordered))
+    assert sorted(result, key=states.index) == states
+    assert result[0] is states[0 if ordered else 1]
+
+
+def test_stage_workers():
+    """Every stage should be served by its own number of workers."""
+    story = _A1()
+    story.barrier = Barrier(2, timeout=5)
+    states = [State(number=2) for _ in range(4)]
+    result = list(run_pipeline(story, states, [2, 1]))
+    assert result == states
+    assert len({state.second for state in states}) == 1
+
+
+def test_nested_stories():
+    """Steps of nested stories should be stages of the same pipeline."""
+    states = [State(number=number) for number in range(1, 4)]
+    result = list(run_pipeline(_B1(), states, [1, 1, 1]))
+    assert [state.result for state in result] == [4, 6, 8]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_fail_fast(ordered):
+    """First failure should stop the pipeline and propagate."""
+    states = [State(number=number) for number in [1, -1, 3, 4, 5, 6, 7, 8]]
+    with pytest.raises(_StepError):
+        list(run_pipeline(_A1(), states, 1, ordered=ordered))
+    assert states[0].result == 2
+    assert not hasattr(states[1], "result")
+
+
+def test_collect_errors():
+    """Exceptions should be collected next to the state which caused them."""
+    states = [State(number=number) for number in [1, -1, 3]]
+    result = list(run_pipeline(_A1(), states, 2, collect=True))
+    assert [state for state, error in result] == states
+    assert result[0][1] is None
+    assert isinstance(result[1][1], _StepError)
+    assert result[2][1] is None
+    assert states[2].result == 6
+
+
+def test_stop_pipeline():
+    """States in progress should not be executed after pipeline is closed."""
+    story = _A1()
+    states = [State(number=number) for number in [3, 0, 4]]
+    results = run_pipeline(story, states, 1)
+    assert next(results) is states[0]
+    Timer(0.05, story.event.set).start()
+    results.close()
+    assert not hasattr(states[1], "second")
+    assert not hasattr(states[2], "first")
+
+
+def test_workers_for_each_step():
+    """Workers should be given for each step of the story."""
+    with pytest.raises(StoryError) as exc_info:
+        run_pipeline(_A1(), [], [1, 2, 3])
+    assert str(exc_info.value) == "run_pipeline expects workers for 2 steps"
+
+
+def test_coroutine_ordered_results():
+    """Stages of coroutine story should be served by tasks."""
+    states = [State(ticks=ticks % 4, log=[]) for ticks in range(20)]
+    result = _collect(_C1(), _states(states), 2)
+    assert result == states
+    assert all(state.log == ["c1s1", "c1s2", "c1s3"] for state in states)
+
+
+def test_coroutine_completed_results():
+    """Results of coroutine story should be given in order of completion."""
+    states = [State(ticks=ticks, log=[]) for ticks in [30, 0, 10]]
+    result = _collect(_C1(), states, [3, 1, 1], ordered=False)
+    assert result == [states[1], states[2], states[0]]
+
+
+def test_coroutine_fail_fast():
+    """First failure of coroutine story should cancel the pipeline."""
+    states = [State(ticks=ticks, log=[]) for ticks in [0, -1, 50, 50, 50, 50, 50]]
+    with pytest.raises(_StepError):
+        _collect(_C1(), states, 1)
+    assert states[0].log == ["c1s1", "c1s2", "c1s3"]
+    assert states[1].log == ["c1s1"]
+    assert states[6].log == []
+
+
+def test_coroutine_collect_errors():
+    """Exceptions of coroutine story should be collected."""
+    states = [State(ticks=ticks, log=[]) for ticks in [0, -1, 0]]
+    result = _collect(_C1(), states, 1, collect=True)
+    assert [state for state, error in result] == states
+    assert isinstance(result[1][1], _StepError)
+    assert result[2] == (states[2], None)
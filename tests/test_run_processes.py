@@ -0,0 +1,119 @@
+"""Tests related to run_processes function."""
+from os import getpid
+
+import pytest
+
+from stories import Argument
+from stories import I
+from stories import initiate
+from stories import run_processes
+from stories import State
+from stories import Story
+from stories import Union
+from stories import Variable
+from stories.exceptions import StoryError
+from validators import _is_integer
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    def a1s1(self, state):
+        state.process = getpid()
+
+    def a1s2(self, state):
+        if state.number < 0:
+            raise _StepError(state.number)
+        state.result = str(sum(range(state.number + 1)))
+
+
+@initiate
+class _B1(Story):
+    I.a1
+    I.b1s1
+
+
+class _B1S1:
+    def __call__(self, state):
+        state.total = state.result + self.offset
+
+    def __init__(self, offset):
+        self.offset = offset
+
+
+class _A1State(State):
+    number = Argument(_is_integer)
+    process = Variable()
+    result = Variable(_is_integer)
+
+
+class _B1State(State):
+    total = Variable(_is_integer)
+
+
+class _StepError(Exception):
+    ...
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_ordered_results(chunksize):
+    """Results should be copies of states made in processes in the same order."""
+    states = [_A1State(number=number) for number in range(10)]
+    result = list(run_processes(_A1(), iter(states), 2, chunksize=chunksize))
+    assert [state.number for state in result] == list(range(10))
+    assert [state.result for state in result] == [0, 1, 3, 6, 10, 15, 21, 28, 36, 45]
+    assert all(state.process != getpid() for state in result)
+    assert all(not hasattr(state, "result") for state in states)
+
+
+def test_completed_results():
+    """Results should be given for all states in order of completion."""
+    states = [_A1State(number=number) for number in range(10)]
+    result = list(run_processes(_A1(), states, 2, 3, ordered=False))
+    assert sorted(state.number for state in result) == list(range(10))
+
+
+def test_union_and_initiate():
+    """Union states and initiated stories could be sent to processes."""
+    state_class = Union(_A1State, _B1State)
+    states = [state_class(number=number) for number in range(3)]
+    story = _B1(a1=_A1(), b1s1=_B1S1(7))
+    result = list(run_processes(story, states, 2))
+    assert all(type(state) is state_class for state in result)
+    assert [state.total for state in result] == [7, 8, 10]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_fail_fast(ordered):
+    """First failure should stop the batch and propagate."""
+    states = [_A1State(number=number) for number in [-1, 1, 2]]
+    with pytest.raises(_StepError) as exc_info:
+        list(run_processes(_A1(), states, 1, ordered=ordered))
+    assert exc_info.value.args == (-1,)
+
+
+def test_collect_errors():
+    """Exceptions should be collected next to the copy of the state."""
+    states = [_A1State(number=number) for number in [1, -1, 2]]
+    result = list(run_processes(_A1(), states, 2, collect=True))
+    assert [state.number for state, error in result] == [1, -1, 2]
+    assert result[0][1] is None
+    assert isinstance(result[1][1], _StepError)
+    assert result[2][1] is None
+    assert result[2][0].result == 3
+
+
+def test_deny_coroutine_stories():
+    """Deny to execute coroutine stories in processes."""
+
+    class A1(Story):
+        I.a1s1
+
+        async def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        run_processes(A1(), [State()], 2)
+    expected = "run_processes can not execute coroutine stories"
+    assert str(exc_info.value) == expected
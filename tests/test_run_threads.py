@@ -0,0 +1,103 @@
+"""Tests related to run_threads function."""
+from threading import Barrier
+from threading import get_ident
+
+import pytest
+
+from stories import Argument
+from stories import I
+from stories import run_threads
+from stories import State
+from stories import Story
+from stories import Variable
+from stories.exceptions import StoryError
+from validators import _is_integer
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    def a1s1(self, state):
+        state.thread = get_ident()
+        self.barrier.wait()
+
+    def a1s2(self, state):
+        if state.number < 0:
+            raise _StepError(state.number)
+        state.result = str(state.number * 2)
+
+    def __init__(self, parties):
+        self.barrier = Barrier(parties)
+
+
+class _A1State(State):
+    number = Argument(_is_integer)
+    thread = Variable()
+    result = Variable(_is_integer)
+
+
+class _StepError(Exception):
+    ...
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_ordered_results(chunksize):
+    """Results should follow order of states."""
+    states = [_A1State(number=number) for number in range(12)]
+    result = list(run_threads(_A1(4), iter(states), 4, chunksize=chunksize))
+    assert result == states
+    assert [state.result for state in states] == list(range(0, 24, 2))
+    assert len({state.thread for state in states}) == 4
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_completed_results(chunksize):
+    """Results should be given for all states in order of completion."""
+    states = [_A1State(number=number) for number in range(12)]
+    result = list(run_threads(_A1(4), states, 4, chunksize, ordered=False))
+    assert sorted(result, key=states.index) == states
+    assert [state.result for state in states] == list(range(0, 24, 2))
+
+
+def test_validate_concurrently():
+    """State validation should stay correct in many threads at once."""
+    states = [_A1State(number=str(number)) for number in range(400)]
+    list(run_threads(_A1(8), states, 8))
+    assert [state.result for state in states] == list(range(0, 800, 2))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_fail_fast(ordered):
+    """First failure should stop the batch and propagate."""
+    states = [_A1State(number=number) for number in [1, -1, 2, 3, 4, 5]]
+    with pytest.raises(_StepError):
+        list(run_threads(_A1(1), states, 1, ordered=ordered))
+    assert states[0].result == 2
+    assert not hasattr(states[5], "thread")
+
+
+def test_collect_errors():
+    """Exceptions should be collected next to the state which caused them."""
+    states = [_A1State(number=number) for number in [1, -1, 2]]
+    result = list(run_threads(_A1(1), states, 2, collect=True))
+    assert [state for state, error in result] == states
+    assert result[0][1] is None
+    assert isinstance(result[1][1], _StepError)
+    assert result[2][1] is None
+    assert states[2].result == 4
+
+
+def test_deny_coroutine_stories():
+    """Deny to execute coroutine stories in threads."""
+
+    class A1(Story):
+        I.a1s1
+
+        async def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        run_threads(A1(), [State()], 2)
+    expected = "run_threads can not execute coroutine stories"
+    assert str(exc_info.value) == expected
@@ -0,0 +1,134 @@
+"""Tests related to Scheduler class."""
+import asyncio
+
+import pytest
+
+from stories import I
+from stories import Scheduler
+from stories import State
+from stories import Story
+from stories.exceptions import StoryError
+
+
+class _A1(Story):
+    I.a1s1
+    I.a1s2
+
+    async def a1s1(self, state):
+        state.log.append(f"{state.name}.a1s1")
+        await asyncio.sleep(0)
+
+    async def a1s2(self, state):
+        if state.name == "fail":
+            raise _StepError(state.name)
+        state.log.append(f"{state.name}.a1s2")
+
+
+class _B1(Story):
+    I.b1s1
+    I.b1s2
+
+    async def b1s1(self, state):
+        await state.event.wait()
+        state.cancel(state.victim)
+
+    async def b1s2(self, state):
+        state.done = True
+
+
+class _StepError(Exception):
+    ...
+
+
+def _gather(scheduler, *runs):
+    async def gather():
+        log = []
+        results = await asyncio.gather(
+            *(
+                scheduler(_A1(), priority)(State(name=name, log=log))
+                for name, priority in runs
+            ),
+            return_exceptions=True,
+        )
+        return log, results
+
+    return asyncio.run(gather())
+
+
+def test_priority_order():
+    """Free slot should be given to the story with smallest priority."""
+    scheduler = Scheduler(1)
+    log, _ = _gather(scheduler, ("b1", 1), ("b2", 1), ("i1", 0))
+    assert log == ["b1.a1s1", "i1.a1s1", "b2.a1s1", "i1.a1s2", "b1.a1s2", "b2.a1s2"]
+    assert scheduler.running == 0
+    assert scheduler.waiting == 0
+
+
+def test_limit_slots():
+    """Stories should not wait while there are free slots."""
+    log, _ = _gather(Scheduler(3), ("b1", 1), ("b2", 1), ("i1", 0))
+    assert log[:3] == ["b1.a1s1", "b2.a1s1", "i1.a1s1"]
+
+
+def test_prevent_starvation():
+    """Priority which was passed over patience times should take the slot."""
+    runs = [("b1", 1)] + [(f"i{number}", 0) for number in range(6)]
+    log, _ = _gather(Scheduler(1, patience=2), *runs)
+    assert log.index("b1.a1s2") < log.index("i5.a1s1")
+
+
+def test_release_on_failure():
+    """Slot of failed step should be released."""
+    scheduler = Scheduler(1)
+    log, results = _gather(scheduler, ("fail", 0), ("b1", 1))
+    assert isinstance(results[0], _StepError)
+    assert log == ["fail.a1s1", "b1.a1s1", "b1.a1s2"]
+    assert scheduler.running == 0
+
+
+def _cancel_soon(task):
+    asyncio.get_running_loop().call_soon(task.cancel)
+
+
+def _cancel_now(task):
+    task.cancel()
+
+
+@pytest.mark.parametrize("cancel", [_cancel_soon, _cancel_now])
+def test_cancel_waiting(cancel):
+    """Cancelled story should leave the queue or release given slot."""
+
+    async def main(scheduler):
+        first = State(event=asyncio.Event(), cancel=cancel)
+        second = State(event=asyncio.Event(), cancel=cancel)
+        runs = [scheduler(_B1(), 0)(state) for state in [first, second]]
+        tasks = [asyncio.create_task(run) for run in runs]
+        waiting = asyncio.create_task(scheduler(_B1(), 1)(State()))
+        first.victim = tasks[1]
+        await asyncio.sleep(0)
+        waiting.cancel()
+        first.event.set()
+        await asyncio.gather(*tasks, waiting, return_exceptions=True)
+        return first, tasks
+
+    scheduler = Scheduler(1)
+    first, tasks = asyncio.run(main(scheduler))
+    assert first.done
+    assert tasks[1].cancelled()
+    assert scheduler.running == 0
+    assert scheduler.waiting == 0
+
+
+def test_deny_function_stories():
+    """Deny to schedule synchronous stories."""
+
+    class A1(Story):
+        I.a1s1
+
+        def a1s1(self, state):
+            raise RuntimeError
+
+    with pytest.raises(StoryError) as exc_info:
+        Scheduler(1)(A1())
+    expected = "Scheduler can execute coroutine stories only"
+    assert str(exc_info.value) == expected
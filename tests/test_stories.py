@@ -1,5 +1,11 @@
 """Tests related to stories module."""
+from copy import copy
+from copy import deepcopy
+from dataclasses import dataclass
+
 import pytest
+from attrs import define
+from attrs import field
 
 from stories import I
 from stories import State
@@ -285,3 +291,123 @@ def test_propagate_exceptions(r, m):
         r.run(story, state)
     assert isinstance(exc_info.value, m._StepError)
     assert str(exc_info.value) == "error in c1s1"
+
+
+def test_reassign_steps(r, m):
+    """Story should use steps reassigned after its previous execution."""
+
+    class A1(Story):
+        I.a1s1
+        I.a1s2
+
+        a1s1 = m._append_method("calls", "a1s1")
+        a1s2 = m._append_method("calls", "a1s2")
+
+    class A2(Story):
+        I.a2s1
+        I.a2s2
+
+        a2s1 = m._append_method("calls", "a2s1")
+        a2s2 = m._append_method("calls", "a2s2")
+
+    class B1(Story):
+        I.a1
+        I.b1s1
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    story = B1()
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["a1s1", "a1s2", "b1s1"]
+
+    story.a1 = A2()
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["a2s1", "a2s2", "b1s1"]
+
+    story.a1 = m._append_method("calls", "a3s1").__get__(story)
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["a3s1", "b1s1"]
+
+
+def test_copy_story(r, m):
+    """Copies of the story should execute steps of their own."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    class A2(Story):
+        I.a2s1
+
+        a2s1 = m._append_method("calls", "a2s1")
+
+    class B1(Story):
+        I.b1s1
+        I.a1
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        def __init__(self):
+            self.a1 = A1()
+
+    story = B1()
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["b1s1", "a1s1"]
+
+    clone = copy(story)
+    clone.a1 = A2()
+    state = State(calls=[])
+    r.run(clone, state)
+    assert state.calls == ["b1s1", "a2s1"]
+
+    clone = deepcopy(story)
+    state = State(calls=[])
+    r.run(clone, state)
+    assert state.calls == ["b1s1", "a1s1"]
+
+    state = State(calls=[])
+    r.run(story, state)
+    assert state.calls == ["b1s1", "a1s1"]
+
+
+def test_field_dependencies(r, m):
+    """Nested stories could be injected into dataclass and attrs fields."""
+
+    class A1(Story):
+        I.a1s1
+
+        a1s1 = m._append_method("calls", "a1s1")
+
+    @dataclass
+    class B1(Story):
+        I.b1s1
+        I.a1
+
+        b1s1 = m._append_method("calls", "b1s1")
+
+        a1: Story = None
+
+    @define(slots=False)
+    class C1(Story):
+        I.c1s1
+        I.a1
+
+        c1s1 = m._append_method("calls", "c1s1")
+
+        a1 = field()
+
+    state = State(calls=[])
+    r.run(B1(a1=A1()), state)
+    assert state.calls == ["b1s1", "a1s1"]
+
+    state = State(calls=[])
+    r.run(C1(a1=A1()), state)
+    assert state.calls == ["c1s1", "a1s1"]
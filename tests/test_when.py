@@ -0,0 +1,136 @@
+"""Tests related to guarded steps."""
+import asyncio
+
+from stories import concurrent
+from stories import dataflow
+from stories import deadline
+from stories import I
+from stories import Profile
+from stories import State
+from stories import Story
+from stories import walk
+
+
+def _discounted(state):
+    return state.discount
+
+
+def _shipped(state):
+    return state.shipped
+
+
+class _B1(Story):
+    I.b1s1
+    I.b1s2
+
+    def b1s1(self, state):
+        state.log.append("b1s1")
+
+    def b1s2(self, state):
+        state.log.append("b1s2")
+
+
+class _A1(Story):
+    I.a1s1.when(_discounted)
+    I.a1s2.when(_discounted).limit(1)
+    I.a1s3.when(_shipped)
+    I.a1s4
+
+    def a1s1(self, state):
+        state.log.append("a1s1")
+
+    def a1s2(self, state):
+        state.log.append("a1s2")
+
+    a1s3 = _B1()
+
+    def a1s4(self, state):
+        state.log.append("a1s4")
+
+
+class _C1(Story):
+    I.c1s1.when(_discounted)
+    I.c1s2.when(_discounted).limit(1)
+    I.c1s3
+
+    async def c1s1(self, state):
+        state.log.append("c1s1")
+
+    async def c1s2(self, state):
+        state.log.append("c1s2")
+
+    async def c1s3(self, state):
+        state.log.append("c1s3")
+
+
+class _D1(Story):
+    I.d1s1.when(lambda state: state.discount)
+
+    def d1s1(self, state):
+        state.total = 1
+
+
+def _state(discount, shipped=False):
+    return State(discount=discount, shipped=shipped, log=[])
+
+
+def test_function_guards():
+    """Steps should be skipped if their guard rejects the state."""
+    state = _state(False)
+    _A1()(state)
+    assert state.log == ["a1s4"]
+    state = _state(True, True)
+    _A1()(state)
+    assert state.log == ["a1s1", "a1s2", "b1s1", "b1s2", "a1s4"]
+
+
+def test_coroutine_guards():
+    """Steps of coroutine story should be skipped if guard rejects the state."""
+    state = _state(False)
+    asyncio.run(_C1()(state))
+    assert state.log == ["c1s3"]
+    state = _state(True)
+    asyncio.run(_C1()(state))
+    assert state.log == ["c1s1", "c1s2", "c1s3"]
+
+
+def test_walk_guards():
+    """Guarded nested story should be walked as a single step."""
+    state = _state(False)
+    walk(_A1())(state)
+    assert state.log == ["a1s4"]
+    state = _state(True, True)
+    walk(_A1())(state)
+    assert state.log == ["a1s1", "a1s2", "b1s1", "b1s2", "a1s4"]
+    state = _state(False)
+    asyncio.run(walk(_C1())(state))
+    assert state.log == ["c1s3"]
+
+
+def test_concurrent_guards():
+    """Skipped steps should not be measured."""
+    profile = Profile()
+    state = _state(False)
+    asyncio.run(concurrent(_C1(), profile)(state))
+    assert state.log == ["c1s3"]
+    assert list(profile.export()) == ["_C1.c1s3"]
+
+
+def test_deadline_guards():
+    """Skipped steps should not be checked against remaining time."""
+    profile = Profile({"_C1.c1s1": 5.0})
+    state = _state(False)
+    asyncio.run(deadline(_C1(), 1, profile)(state))
+    assert state.log == ["c1s3"]
+
+
+def test_dataflow_guards():
+    """Guard should be analyzed as a part of the step."""
+    graph = dataflow(_A1)
+    assert graph["a1s1"].reads == {"discount", "log"}
+    assert graph["a1s3"].reads == {"shipped", "log"}
+    assert graph["a1s3"].writes == set()
+    assert dataflow(_D1)["d1s1"].reads is None
+    state = State(discount=True)
+    _D1()(state)
+    assert state.total == 1